@@ -6,9 +6,12 @@ Run with:  ghostwriter   (or  python -m ghostwriter.app)
 from __future__ import annotations
 
 import re
+import sys
+import threading
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from textual import on, work
 from textual.app import App, ComposeResult
@@ -30,11 +33,24 @@ from textual.worker import Worker, WorkerState
 # ---------------------------------------------------------------------------
 
 _TOKEN_RE = re.compile(r"[A-Za-z]+")
+_token_finditer = _TOKEN_RE.finditer
+
+# Byte translation table marking ASCII letters as 1 and everything else as 0.
+# Lets _tokenize_line find word runs with bytes.find instead of the regex VM.
+_WORD_TBL = bytes.maketrans(
+    bytes(range(256)),
+    bytes(1 if chr(i).isalpha() and i < 128 else 0 for i in range(256)),
+)
 
 
-@dataclass
+@dataclass(eq=False)
 class Token:
-    """A piece of text in the poem — either a word or non-word."""
+    """A piece of text in the poem — either a word or non-word.
+
+    Tokens compare by identity so they can be looked up and removed from
+    the app's tagged list without matching a different token with the
+    same text.
+    """
 
     text: str
     is_word: bool = False
@@ -42,6 +58,9 @@ class Token:
     candidates: list[str] = field(default_factory=list)
     cycle_index: int = 0
     locked: bool = False
+    pad_width: int = 0  # widest of text / candidates, for stable cycling
+    row: int = 0  # editor line this token was tokenized from
+    col: int = 0  # index of this token within its line's tokens
 
     @property
     def display(self) -> str:
@@ -49,23 +68,91 @@ class Token:
             return self.candidates[self.cycle_index]
         return self.text
 
+    def set_candidates(self, words: list[str]) -> None:
+        """Replace the candidates and reset the cycle state."""
+        self.candidates = [sys.intern(w) for w in words]
+        self.cycle_index = 0
+        self.locked = False
+        self.pad_width = max(len(self.text), max(map(len, words), default=0))
+
 
 def _tokenize_line(line: str) -> list[Token]:
     """Split a line into alternating word / non-word tokens."""
+    if not line.isascii():
+        return _tokenize_line_re(line)
+    tokens: list[Token] = []
+    mask = line.encode("ascii").translate(_WORD_TBL)
+    intern = sys.intern
+    n = len(mask)
+    pos = 0
+    while pos < n:
+        start = mask.find(1, pos)
+        if start == -1:
+            break
+        if start > pos:
+            tokens.append(Token(text=intern(line[pos:start])))
+        end = mask.find(0, start)
+        if end == -1:
+            end = n
+        tokens.append(Token(text=intern(line[start:end]), is_word=True))
+        pos = end
+    if pos < n:
+        tokens.append(Token(text=intern(line[pos:])))
+    if not tokens:
+        tokens.append(Token(text=""))
+    return tokens
+
+
+def _tokenize_line_re(line: str) -> list[Token]:
+    """Regex tokenizer used for lines containing non-ASCII characters."""
     tokens: list[Token] = []
+    append = tokens.append
+    intern = sys.intern
     last = 0
-    for m in _TOKEN_RE.finditer(line):
-        if m.start() > last:
-            tokens.append(Token(text=line[last : m.start()]))
-        tokens.append(Token(text=m.group(), is_word=True))
-        last = m.end()
+    for m in _token_finditer(line):
+        start, end = m.span()
+        if start > last:
+            append(Token(text=intern(line[last:start])))
+        append(Token(text=intern(line[start:end]), is_word=True))
+        last = end
     if last < len(line):
-        tokens.append(Token(text=line[last:]))
+        append(Token(text=intern(line[last:])))
     if not tokens:
-        tokens.append(Token(text=""))
+        append(Token(text=""))
     return tokens
 
 
+def _static_display(t: Token) -> str:
+    """How a token renders in the editor outside cycling."""
+    return t.display
+
+
+def _make_cycling_display(highlight: bool) -> Callable[[Token], str]:
+    """Build the editor renderer used while cycling.
+
+    Tagged words are padded to the width of the longest candidate
+    (including the original word) so the layout stays stable.  With
+    *highlight* on, unlocked cycling words get «guillemet» markers.  The
+    highlight choice is baked in so the per-token path doesn't re-check it.
+    """
+    if highlight:
+
+        def display(t: Token) -> str:
+            if t.tagged and t.candidates:
+                padded = t.candidates[t.cycle_index].ljust(t.pad_width)
+                return padded if t.locked else f"«{padded}»"
+            return t.text
+
+    else:
+
+        def display(t: Token) -> str:
+            if t.tagged and t.candidates:
+                return t.candidates[t.cycle_index].ljust(t.pad_width)
+            return t.text
+
+    return display
+
+
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
@@ -159,12 +246,39 @@ class GhostwriterApp(App):
     def __init__(self) -> None:
         super().__init__()
         self.morphed: dict[str, str] = {}
+        self._morphed_words: Optional[frozenset[str]] = None
+        self._morphed_rendered = ""
+        self._morphed_shown: Optional[str] = None
+        self._tagged_panel_sig: tuple = ()
         self._model_ready = False
         self._poem_tokens: list[list[Token]] = []
-        self._tokenized_text: str = ""
+        self._line_text: list[str] = []
+        self._col_index: list[list[int]] = []
+        self._line_context_cache: list[Optional[list[str]]] = []
+        self._tagged: list[Token] = []
+        self._pending_morph: dict[str, list[Token]] = {}
+        self._tag_batch: dict[str, list[str]] = {}
+        self._tag_batch_vibe = ""
+        self._tag_debounce: Optional[Timer] = None
+        self._vibe_debounce: Optional[Timer] = None
         self._cycling = False
+        # Token -> editor text; swapped for a cycling renderer while cycling.
+        self._editor_display: Callable[[Token], str] = _static_display
         self._cycle_timer: Optional[Timer] = None
         self._highlight: bool = True
+        self._refresh_pending = False
+        self._editor_dirty = False
+        # Worker group -> completion handler, see _on_worker_state.
+        self._worker_handlers: dict[
+            str, Callable[[Worker.StateChanged], None]
+        ] = {
+            "model": self._model_state,
+            "morph_batch": self._batch_morph_done,
+            "morph_add": self._add_morph_done,
+            "render": self._render_done,
+            "push": self._push_done,
+            "share": self._share_done,
+        }
 
     # ---- layout ----------------------------------------------------------
 
@@ -194,11 +308,19 @@ class GhostwriterApp(App):
     # ---- lifecycle -------------------------------------------------------
 
     def on_mount(self) -> None:
+        self._editor = self.query_one("#editor", TextArea)
+        self._status = self.query_one("#status-bar", Static)
+        self._vibe = self.query_one("#vibe-input", Input)
+        self._tagged_panel = self.query_one("#tagged-list", Static)
+        self._morphed_panel = self.query_one("#morphed-list", Static)
         self._load_model()
         self._cycle_timer = self.set_interval(
             2.5, self._cycle_tick, pause=True
         )
 
+    def _status_set(self, message: str) -> None:
+        self._status.update(message)
+
     @work(thread=True, group="model")
     def _load_model(self) -> None:
         """Download / cache the GloVe model in a background thread."""
@@ -207,93 +329,233 @@ class GhostwriterApp(App):
         load_model()
         self._model_ready = True
 
-    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
-        if event.worker.group == "model":
-            bar = self.query_one("#status-bar", Static)
-            if event.state == WorkerState.RUNNING:
-                bar.update("Loading embeddings (first run downloads ~128 MB)…")
-            elif event.state == WorkerState.SUCCESS:
-                bar.update("Ready — F2 to tag words, F5 to cycle")
-            elif event.state == WorkerState.ERROR:
-                bar.update(f"Model load failed: {event.worker.error}")
+    @on(Worker.StateChanged)
+    def _on_worker_state(self, event: Worker.StateChanged) -> None:
+        """Route a worker state change to its group's handler."""
+        handler = self._worker_handlers.get(event.worker.group)
+        if handler is not None:
+            handler(event)
+
+    def _model_state(self, event: Worker.StateChanged) -> None:
+        bar = self._status
+        if event.state == WorkerState.RUNNING:
+            bar.update("Loading embeddings (first run downloads ~128 MB)…")
+        elif event.state == WorkerState.SUCCESS:
+            bar.update("Ready — F2 to tag words, F5 to cycle")
+        elif event.state == WorkerState.ERROR:
+            bar.update(f"Model load failed: {event.worker.error}")
+
+    # ---- vibe prefetch ---------------------------------------------------
+
+    @on(Input.Changed, "#vibe-input")
+    def _on_vibe_changed(self, event: Input.Changed) -> None:
+        """Warm the morph cache once the user stops typing a vibe."""
+        if self._vibe_debounce is not None:
+            self._vibe_debounce.stop()
+        self._vibe_debounce = self.set_timer(0.4, self._prefetch_vibe)
+
+    def _prefetch_vibe(self) -> None:
+        self._vibe_debounce = None
+        vibe = self._vibe.value.strip()
+        if not vibe or not self._model_ready or self._cycling:
+            return
+        self._ensure_tokenized()
+        tagged = self._tagged_words()
+        if not tagged:
+            return
+        words = [t.text.lower() for t in tagged]
+        contexts = [self._line_context(t) for t in tagged]
+        self._run_prefetch_morph(words, vibe, contexts)
+
+    @work(
+        thread=True, group="morph_prefetch", exclusive=True, exit_on_error=False
+    )
+    def _run_prefetch_morph(
+        self, words: list[str], vibe: str, contexts: list[list[str]]
+    ) -> None:
+        """Morph the tagged words for *vibe* so F5 finds them cached.
+
+        Best effort: a failure here only means F5 morphs from scratch, so it
+        must never take the app down.
+        """
+        from ghostwriter.morph import morph_words
+
+        morph_words(words, vibe, contexts=contexts)
 
     # ---- tokenizer -------------------------------------------------------
 
     def _ensure_tokenized(self) -> None:
-        """Tokenize the editor text if it changed since last tokenization."""
-        editor = self.query_one("#editor", TextArea)
-        text = editor.text
-        if text != self._tokenized_text:
-            self._poem_tokens = [
-                _tokenize_line(line) for line in text.splitlines()
-            ]
-            self._tokenized_text = text
+        """Re-tokenize only the editor lines that changed since last time.
 
-    def _editor_display(self, t: Token) -> str:
-        """How a token renders in the editor during cycling.
-
-        During cycling, tagged words are padded to the width of the longest
-        candidate (including the original word) so the layout stays stable.
-        When highlight is on, unlocked cycling words get «guillemet» markers.
+        Each line's text is remembered alongside its tokens, so an edit
+        costs O(line length) instead of a rescan of the whole poem, and
+        tags on untouched lines survive the edit.
         """
-        if self._cycling and t.tagged and t.candidates:
-            word = t.candidates[t.cycle_index]
-            max_len = max(len(t.text), *(len(c) for c in t.candidates))
-            padded = word.ljust(max_len)
-            if self._highlight and not t.locked:
-                return f"«{padded}»"
-            return padded
-        return t.display
+        # The document already holds the text split into rows; joining it
+        # into editor.text only to split it again would walk it twice.
+        lines = self._editor.document.lines
+        tokens = self._poem_tokens
+        known = self._line_text
+        cols = self._col_index
+        ctx = self._line_context_cache
+        dropped = False
+        for i, line in enumerate(lines):
+            if i < len(known) and known[i] == line:
+                continue
+            line_tokens = _tokenize_line(line)
+            for j, t in enumerate(line_tokens):
+                t.row = i
+                t.col = j
+            if i >= len(known):
+                tokens.append(line_tokens)
+                known.append(line)
+                cols.append(self._line_offsets(line_tokens))
+                ctx.append(None)
+            else:
+                dropped = dropped or any(t.tagged for t in tokens[i])
+                tokens[i] = line_tokens
+                known[i] = line
+                cols[i] = self._line_offsets(line_tokens)
+                ctx[i] = None
+        for line_tokens in tokens[len(lines):]:
+            dropped = dropped or any(t.tagged for t in line_tokens)
+        del tokens[len(lines):]
+        del known[len(lines):]
+        del cols[len(lines):]
+        del ctx[len(lines):]
+        if dropped:
+            # Tags on a re-tokenized line are gone with its old tokens.
+            self._tagged = [
+                t
+                for t in self._tagged
+                if t.row < len(tokens) and t in tokens[t.row]
+            ]
+
+    def _line_offsets(self, line_tokens: list[Token]) -> list[int]:
+        """Cumulative end column of each token as shown in the editor."""
+        ends: list[int] = []
+        pos = 0
+        for t in line_tokens:
+            pos += len(self._editor_display(t))
+            ends.append(pos)
+        return ends
 
     def _rebuild_text(self) -> str:
-        """Rebuild display text from tokens (padded + markers during cycling)."""
-        return "\n".join(
-            "".join(self._editor_display(t) for t in line_tokens)
-            for line_tokens in self._poem_tokens
-        )
+        """Rebuild display text from tokens (padded + markers during cycling).
+
+        Also refreshes the column index used by _token_at_cursor, since the
+        returned text is what the editor is about to show.
+        """
+        display = self._editor_display
+        buf: list[str] = []
+        append = buf.append
+        col_index: list[list[int]] = []
+        for line_tokens in self._poem_tokens:
+            ends: list[int] = []
+            pos = 0
+            for t in line_tokens:
+                shown = display(t)
+                append(shown)
+                pos += len(shown)
+                ends.append(pos)
+            col_index.append(ends)
+            append("\n")
+        if buf:
+            buf.pop()
+        self._col_index = col_index
+        return "".join(buf)
 
     def _final_text(self) -> str:
         """Rebuild text with actual replacements — no padding or markers."""
-        return "\n".join(
-            "".join(t.display for t in line_tokens)
-            for line_tokens in self._poem_tokens
-        )
+        buf: list[str] = []
+        append = buf.append
+        for line_tokens in self._poem_tokens:
+            for t in line_tokens:
+                append(t.display)
+            append("\n")
+        if buf:
+            buf.pop()
+        return "".join(buf)
 
     def _refresh_editor(self) -> None:
-        """Reload editor text from tokens, preserving cursor position."""
-        editor = self.query_one("#editor", TextArea)
+        """Bring the editor text in line with the tokens."""
+        self._apply_text(self._rebuild_text())
+
+    def _apply_text(self, text: str) -> None:
+        """Make the editor show *text*, touching only what differs.
+
+        Only the changed span of each changed line is rewritten, so the
+        cursor stays put and TextArea keeps its document.  A change in the
+        number of lines falls back to a full reload.
+        """
+        editor = self._editor
+        new_lines = text.split("\n")
+        old_lines = list(editor.document.lines)
+        if len(old_lines) != len(new_lines):
+            self._reload_editor(editor, text)
+            return
+        with editor.prevent(TextArea.Changed):
+            for row, (old, new) in enumerate(zip(old_lines, new_lines)):
+                if old == new:
+                    continue
+                start = 0
+                limit = min(len(old), len(new))
+                while start < limit and old[start] == new[start]:
+                    start += 1
+                end = 0
+                limit -= start
+                while end < limit and old[-1 - end] == new[-1 - end]:
+                    end += 1
+                editor.replace(
+                    new[start:len(new) - end],
+                    (row, start),
+                    (row, len(old) - end),
+                )
+        # Cycling output is not user history; keep undo from reverting it.
+        editor.history.clear()
+
+    def _reload_editor(self, editor: TextArea, text: str) -> None:
+        """Replace the whole editor document, preserving cursor position."""
         cursor = editor.cursor_location
-        editor.load_text(self._rebuild_text())
-        new_lines = editor.text.splitlines()
-        if new_lines:
-            row = min(cursor[0], len(new_lines) - 1)
-            col = min(cursor[1], len(new_lines[row]))
-        else:
-            row, col = 0, 0
+        editor.load_text(text)
+        # The document already holds its lines; no need to re-split the text.
+        new_lines = editor.document.lines
+        row = min(cursor[0], len(new_lines) - 1)
+        col = min(cursor[1], len(new_lines[row]))
         editor.cursor_location = (row, col)
 
     def _token_at_cursor(self) -> Optional[Token]:
         """Find the word Token at the current cursor position."""
-        editor = self.query_one("#editor", TextArea)
+        editor = self._editor
         row, col = editor.cursor_location
         if row >= len(self._poem_tokens):
             return None
-        pos = 0
-        for token in self._poem_tokens[row]:
-            end_pos = pos + len(self._editor_display(token))
-            if pos <= col < end_pos and token.is_word:
+        ends = self._col_index[row]
+        idx = bisect_right(ends, col)
+        if idx < len(ends):
+            token = self._poem_tokens[row][idx]
+            if token.is_word:
                 return token
-            pos = end_pos
         return None
 
     def _tagged_words(self) -> list[Token]:
-        """All currently tagged tokens."""
-        return [
-            t
-            for line_tokens in self._poem_tokens
-            for t in line_tokens
-            if t.tagged
-        ]
+        """All currently tagged tokens, in poem order."""
+        return self._tagged
+
+    def _set_tagged(self, token: Token, tagged: bool) -> None:
+        """Flip *token*'s tagged state and keep ``_tagged`` in step."""
+        if token.tagged == tagged:
+            return
+        token.tagged = tagged
+        if tagged:
+            at = bisect_right(
+                self._tagged,
+                (token.row, token.col),
+                key=lambda t: (t.row, t.col),
+            )
+            self._tagged.insert(at, token)
+        else:
+            self._tagged.remove(token)
 
     def _line_context(self, token: Token) -> list[str]:
         """Return the words from the line containing *token*.
@@ -301,10 +563,14 @@ class GhostwriterApp(App):
         This gives the POS tagger surrounding context so it can
         disambiguate words like "understanding" (noun vs. verb).
         """
-        for line_tokens in self._poem_tokens:
-            if token in line_tokens:
-                return [t.text.lower() for t in line_tokens if t.is_word]
-        return []
+        row = token.row
+        if row >= len(self._poem_tokens):
+            return []
+        words = self._line_context_cache[row]
+        if words is None:
+            words = [t.text.lower() for t in self._poem_tokens[row] if t.is_word]
+            self._line_context_cache[row] = words
+        return words
 
     # ---- tag / untag (F2) ------------------------------------------------
 
@@ -319,9 +585,7 @@ class GhostwriterApp(App):
         if self._cycling:
             token = self._token_at_cursor()
             if token is None:
-                self.query_one("#status-bar", Static).update(
-                    "Place cursor on a word"
-                )
+                self._status_set("Place cursor on a word")
                 return
 
             if token.tagged:
@@ -331,16 +595,13 @@ class GhostwriterApp(App):
                     if token.candidates
                     else token.text
                 )
-                self.morphed[token.text.lower()] = current.lower()
+                self._record_morph(token.text.lower(), current.lower())
                 token.text = current
-                token.tagged = False
-                token.candidates = []
-                token.cycle_index = 0
-                token.locked = False
+                self._line_context_cache[token.row] = None
+                self._set_tagged(token, False)
+                token.set_candidates([])
                 self._refresh_morphed_list()
-                self.query_one("#status-bar", Static).update(
-                    f"Committed: {current}"
-                )
+                self._status_set(f"Committed: {current}")
 
                 still_cycling = [
                     t
@@ -350,36 +611,34 @@ class GhostwriterApp(App):
                 if not still_cycling:
                     self._finish_cycling()
                 else:
-                    self._refresh_editor()
-                self._refresh_tagged_panel()
+                    self._schedule_refresh()
             else:
                 # Tag a new word and compute morphs in the background
                 if not token.is_word:
                     return
-                token.tagged = True
-                vibe = self.query_one("#vibe-input", Input).value.strip()
+                self._set_tagged(token, True)
+                vibe = self._vibe.value.strip()
                 if vibe:
-                    ctx = self._line_context(token)
-                    self.query_one("#status-bar", Static).update(
+                    self._status_set(
                         f"Tagged: {token.text} — computing morphs…"
                     )
-                    self._run_add_morph(token.text.lower(), vibe, ctx)
-                self._refresh_tagged_panel()
+                    word = token.text.lower()
+                    self._pending_morph.setdefault(word, []).append(token)
+                    self._queue_add_morph(word, vibe, self._line_context(token))
+                self._schedule_refresh(editor=False)
             return
 
         # -- not cycling: normal tag / untag --------------------------------
         self._ensure_tokenized()
         token = self._token_at_cursor()
         if token is None:
-            self.query_one("#status-bar", Static).update(
-                "Place cursor on a word"
-            )
+            self._status_set("Place cursor on a word")
             return
 
-        token.tagged = not token.tagged
+        self._set_tagged(token, not token.tagged)
         verb = "Tagged" if token.tagged else "Untagged"
-        self.query_one("#status-bar", Static).update(f"{verb}: {token.text}")
-        self._refresh_tagged_panel()
+        self._status_set(f"{verb}: {token.text}")
+        self._schedule_refresh(editor=False)
 
     # ---- stop cycling (Escape) -------------------------------------------
 
@@ -396,31 +655,23 @@ class GhostwriterApp(App):
             return
 
         if not self._model_ready:
-            self.query_one("#status-bar", Static).update(
-                "Model still loading…"
-            )
+            self._status_set("Model still loading…")
             return
 
-        vibe = self.query_one("#vibe-input", Input).value.strip()
+        vibe = self._vibe.value.strip()
         if not vibe:
-            self.query_one("#status-bar", Static).update(
-                "Enter a vibe word first"
-            )
+            self._status_set("Enter a vibe word first")
             return
 
         self._ensure_tokenized()
         tagged = self._tagged_words()
         if not tagged:
-            self.query_one("#status-bar", Static).update(
-                "Tag some words first (F2)"
-            )
+            self._status_set("Tag some words first (F2)")
             return
 
         words = [t.text.lower() for t in tagged]
         contexts = [self._line_context(t) for t in tagged]
-        self.query_one("#status-bar", Static).update(
-            f"Computing morphs for {len(words)} words…"
-        )
+        self._status_set(f"Computing morphs for {len(words)} words…")
         self._run_batch_morph(words, vibe, contexts)
 
     @work(thread=True, group="morph_batch")
@@ -431,92 +682,83 @@ class GhostwriterApp(App):
 
         return morph_words(words, vibe, contexts=contexts)
 
-    @on(Worker.StateChanged)
     def _batch_morph_done(self, event: Worker.StateChanged) -> None:
-        if event.worker.group != "morph_batch":
-            return
         if event.state == WorkerState.SUCCESS:
             results = event.worker.result
             tagged = self._tagged_words()
 
             for token, morph_result in zip(tagged, results):
-                token.candidates = [c.word for c in morph_result.candidates]
-                token.cycle_index = 0
-                token.locked = False
+                token.set_candidates([c.word for c in morph_result.candidates])
 
             # Untag words that got no candidates
-            for t in tagged:
+            for t in list(tagged):
                 if not t.candidates:
-                    t.tagged = False
+                    self._set_tagged(t, False)
 
-            active = [t for t in tagged if t.candidates]
+            active = list(tagged)
             if not active:
-                self.query_one("#status-bar", Static).update(
-                    "No candidates found for any tagged word"
-                )
-                self._refresh_tagged_panel()
+                self._status_set("No candidates found for any tagged word")
+                self._schedule_refresh(editor=False)
                 return
 
             self._cycling = True
-            editor = self.query_one("#editor", TextArea)
-            editor.read_only = True
-            editor.load_text(self._rebuild_text())
+            self._editor_display = _make_cycling_display(self._highlight)
+            self._editor.read_only = True
+            self._refresh_editor()
             if self._cycle_timer:
                 self._cycle_timer.resume()
-            self.query_one("#status-bar", Static).update(
+            self._status_set(
                 f"Cycling {len(active)} words — F7=lock  F6=freeze  F8=highlight"
             )
-            self._refresh_tagged_panel()
+            self._schedule_refresh(editor=False)
 
         elif event.state == WorkerState.ERROR:
-            self.query_one("#status-bar", Static).update(
-                f"Morph error: {event.worker.error}"
-            )
+            self._status_set(f"Morph error: {event.worker.error}")
+
+    # ---- add words mid-cycle (background morph) --------------------------
 
-    # ---- add single word mid-cycle (background morph) --------------------
+    def _queue_add_morph(self, word: str, vibe: str, context: list[str]) -> None:
+        """Collect mid-cycle tags for 150 ms, then morph them in one call."""
+        self._tag_batch.setdefault(word, context)
+        self._tag_batch_vibe = vibe
+        if self._tag_debounce is not None:
+            self._tag_debounce.stop()
+        self._tag_debounce = self.set_timer(0.15, self._flush_tag_batch)
+
+    def _flush_tag_batch(self) -> None:
+        self._tag_debounce = None
+        if not self._tag_batch:
+            return
+        words = list(self._tag_batch)
+        contexts = list(self._tag_batch.values())
+        self._tag_batch = {}
+        self._run_add_morph(words, self._tag_batch_vibe, contexts)
 
     @work(thread=True, group="morph_add")
-    def _run_add_morph(self, word_lower: str, vibe: str, context: list[str] | None = None):
-        from ghostwriter.morph import morph_word
+    def _run_add_morph(
+        self, words: list[str], vibe: str, contexts: list[list[str]]
+    ) -> list:
+        from ghostwriter.morph import morph_words
 
-        return morph_word(word_lower, vibe, context=context)
+        return morph_words(words, vibe, contexts=contexts)
 
-    @on(Worker.StateChanged)
     def _add_morph_done(self, event: Worker.StateChanged) -> None:
-        if event.worker.group != "morph_add":
-            return
         if event.state == WorkerState.SUCCESS:
-            result = event.worker.result
-            # Find the matching token (tagged, no candidates yet)
-            for line_tokens in self._poem_tokens:
-                for token in line_tokens:
-                    if (
-                        token.tagged
-                        and not token.candidates
-                        and token.text.lower() == result.original
-                    ):
-                        token.candidates = [
-                            c.word for c in result.candidates
-                        ]
-                        token.cycle_index = 0
-                        token.locked = False
-                        if not token.candidates:
-                            token.tagged = False
-                            self.query_one("#status-bar", Static).update(
-                                f"No candidates for: {token.text}"
-                            )
-                        else:
-                            self.query_one("#status-bar", Static).update(
-                                f"Now cycling: {token.text}"
-                            )
-                        break
-            if self._cycling:
-                self._refresh_editor()
-            self._refresh_tagged_panel()
+            for result in event.worker.result:
+                words = [c.word for c in result.candidates]
+                for token in self._pending_morph.pop(result.original, []):
+                    # Skip tokens untagged (or re-tokenized away) meanwhile.
+                    if not token.tagged or token.candidates:
+                        continue
+                    token.set_candidates(list(words))
+                    if not words:
+                        self._set_tagged(token, False)
+                        self._status_set(f"No candidates for: {token.text}")
+                    else:
+                        self._status_set(f"Now cycling: {token.text}")
+            self._schedule_refresh()
         elif event.state == WorkerState.ERROR:
-            self.query_one("#status-bar", Static).update(
-                f"Morph error: {event.worker.error}"
-            )
+            self._status_set(f"Morph error: {event.worker.error}")
 
     # ---- cycling timer ---------------------------------------------------
 
@@ -524,17 +766,49 @@ class GhostwriterApp(App):
         """Advance each unlocked tagged word to its next candidate."""
         if not self._cycling:
             return
-        changed = False
-        for line_tokens in self._poem_tokens:
-            for token in line_tokens:
-                if token.tagged and not token.locked and token.candidates:
-                    token.cycle_index = (
-                        (token.cycle_index + 1) % len(token.candidates)
-                    )
-                    changed = True
-        if changed:
-            self._refresh_editor()
-            self._refresh_tagged_panel()
+        # Padding keeps every cycling word at a fixed width, so each advance
+        # can be written in place over its old span instead of reloading
+        # the whole buffer.
+        edits: list[tuple[str, tuple[int, int], tuple[int, int]]] = []
+        # A reload is already queued for this frame; just advance the words.
+        stale = self._editor_dirty
+        for token in self._tagged_words():
+            if token.locked or not token.candidates:
+                continue
+            token.cycle_index = (token.cycle_index + 1) % len(token.candidates)
+            if stale:
+                continue
+            shown = self._editor_display(token)
+            row = token.row
+            if row >= len(self._col_index):
+                stale = True
+                continue
+            line_tokens = self._poem_tokens[row]
+            ends = self._col_index[row]
+            i = token.col
+            if i >= len(line_tokens) or line_tokens[i] is not token:
+                stale = True
+                continue
+            if len(ends) != len(line_tokens):
+                stale = True
+                continue
+            start = ends[i - 1] if i else 0
+            if ends[i] - start != len(shown):
+                stale = True
+                continue
+            edits.append((shown, (row, start), (row, ends[i])))
+        if not edits and not stale:
+            return
+        if stale:
+            self._schedule_refresh()
+            return
+        editor = self._editor
+        with editor.prevent(TextArea.Changed):
+            for shown, start, end in edits:
+                editor.replace(shown, start, end)
+        # Cycling output is not user history; keep undo from reverting it.
+        editor.history.clear()
+        self._schedule_refresh(editor=False)
 
     # ---- lock word (F7) --------------------------------------------------
 
@@ -545,17 +819,13 @@ class GhostwriterApp(App):
 
         token = self._token_at_cursor()
         if token is None or not token.tagged or token.locked:
-            self.query_one("#status-bar", Static).update(
-                "Place cursor on a cycling word"
-            )
+            self._status_set("Place cursor on a cycling word")
             return
 
         token.locked = True
-        self.morphed[token.text.lower()] = token.display.lower()
+        self._record_morph(token.text.lower(), token.display.lower())
         self._refresh_morphed_list()
-        self.query_one("#status-bar", Static).update(
-            f"Locked: {token.text} → {token.display}"
-        )
+        self._status_set(f"Locked: {token.text} → {token.display}")
 
         still_cycling = [
             t
@@ -564,7 +834,8 @@ class GhostwriterApp(App):
         ]
         if not still_cycling:
             self._finish_cycling()
-        self._refresh_tagged_panel()
+        else:
+            self._schedule_refresh()
 
     # ---- freeze all (F6) -------------------------------------------------
 
@@ -576,7 +847,7 @@ class GhostwriterApp(App):
         for token in self._tagged_words():
             if not token.locked and token.candidates:
                 token.locked = True
-                self.morphed[token.text.lower()] = token.display.lower()
+                self._record_morph(token.text.lower(), token.display.lower())
 
         self._refresh_morphed_list()
         self._finish_cycling()
@@ -584,27 +855,61 @@ class GhostwriterApp(App):
     def _finish_cycling(self) -> None:
         """Stop cycling and return to editing mode."""
         self._cycling = False
+        self._editor_display = _static_display
         if self._cycle_timer:
             self._cycle_timer.pause()
 
-        editor = self.query_one("#editor", TextArea)
-        editor.read_only = False
-        final_text = self._final_text()
-        editor.load_text(final_text)
+        self._editor.read_only = False
+        self._apply_text(self._final_text())
 
         self._poem_tokens = []
-        self._tokenized_text = ""
-
-        self.query_one("#status-bar", Static).update(
-            "Frozen — F2 to tag more words, F3 to render PDF"
-        )
-        self._refresh_tagged_panel()
+        self._line_text = []
+        self._col_index = []
+        self._line_context_cache = []
+        self._tagged = []
+        self._pending_morph = {}
+        self._tag_batch = {}
+        if self._tag_debounce is not None:
+            self._tag_debounce.stop()
+            self._tag_debounce = None
+
+        self._status_set("Frozen — F2 to tag more words, F3 to render PDF")
+        self._schedule_refresh(editor=False)
 
     # ---- side panel ------------------------------------------------------
 
+    def _schedule_refresh(self, editor: bool = True) -> None:
+        """Queue an editor reload and/or tagged-panel update for this frame.
+
+        Repeated calls before the next refresh collapse into one pass, so a
+        tick and a morph landing together only reload the editor once.
+        """
+        self._editor_dirty = self._editor_dirty or editor
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.call_after_refresh(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        editor_dirty = self._editor_dirty
+        self._refresh_pending = False
+        self._editor_dirty = False
+        if editor_dirty and self._cycling:
+            self._refresh_editor()
+        self._refresh_tagged_panel()
+
     def _refresh_tagged_panel(self) -> None:
         tagged = self._tagged_words()
-        panel = self.query_one("#tagged-list", Static)
+        # Most ticks leave the panel text unchanged (e.g. every word locked
+        # or waiting); skip the markup re-parse when nothing shown differs.
+        sig = (
+            self._highlight,
+            tuple((t.text, t.display, t.locked, bool(t.candidates)) for t in tagged),
+        )
+        if sig == self._tagged_panel_sig:
+            return
+        self._tagged_panel_sig = sig
+        panel = self._tagged_panel
         if not tagged:
             panel.update("(none)")
             return
@@ -624,57 +929,77 @@ class GhostwriterApp(App):
                 lines.append(f"  {t.text} (waiting…)")
         panel.update("\n".join(lines))
 
+    def _morphed_word_set(self) -> frozenset[str]:
+        """Replacement words for the renderer, rebuilt only after a change."""
+        if self._morphed_words is None:
+            self._morphed_words = frozenset(self.morphed.values())
+        return self._morphed_words
+
+    def _record_morph(self, word: str, replacement: str) -> None:
+        """Store a committed morph and extend the rendered panel text.
+
+        New words are appended to the cached text; only overwriting an
+        existing word (whose line sits mid-list) re-renders all of it.
+        """
+        word = sys.intern(word)
+        replacement = sys.intern(replacement)
+        if word in self.morphed:
+            self.morphed[word] = replacement
+            self._morphed_rendered = "\n".join(
+                f"  {k} → {v}" for k, v in self.morphed.items()
+            )
+        else:
+            self.morphed[word] = replacement
+            line = f"  {word} → {replacement}"
+            if self._morphed_rendered:
+                self._morphed_rendered += "\n" + line
+            else:
+                self._morphed_rendered = line
+
     def _refresh_morphed_list(self) -> None:
-        if not self.morphed:
-            self.query_one("#morphed-list", Static).update("(none yet)")
+        self._morphed_words = None
+        if self._morphed_rendered == self._morphed_shown:
             return
-        lines = [f"  {k} → {v}" for k, v in self.morphed.items()]
-        self.query_one("#morphed-list", Static).update("\n".join(lines))
+        self._morphed_shown = self._morphed_rendered
+        self._morphed_panel.update(self._morphed_rendered or "(none yet)")
 
     # ---- highlight toggle (F8) -------------------------------------------
 
     def action_toggle_highlight(self) -> None:
         """Toggle yellow highlighting of cycling words."""
         self._highlight = not self._highlight
+        if self._cycling:
+            self._editor_display = _make_cycling_display(self._highlight)
         state = "on" if self._highlight else "off"
-        self.query_one("#status-bar", Static).update(f"Highlight: {state}")
+        self._status_set(f"Highlight: {state}")
         if self._cycling:
-            self._refresh_editor()
-            self._refresh_tagged_panel()
+            self._schedule_refresh()
 
     # ---- render / push ---------------------------------------------------
 
     def action_render_pdf(self) -> None:
-        editor = self.query_one("#editor", TextArea)
+        editor = self._editor
         text = editor.text.strip()
         if not text:
-            self.query_one("#status-bar", Static).update("Nothing to render")
+            self._status_set("Nothing to render")
             return
-        self._do_render(text)
+        self._do_render(text, self._morphed_word_set())
 
     @work(thread=True, group="render")
-    def _do_render(self, text: str) -> Path:
+    def _do_render(self, text: str, morphed_words: frozenset[str]) -> Path:
         from ghostwriter.render import render_poem
 
         lines = text.splitlines()
-        morphed_set = set(self.morphed.values())
         path = render_poem(
-            lines, output="ghost.pdf", morphed_words=morphed_set
+            lines, output="ghost.pdf", morphed_words=morphed_words
         )
         return path
 
-    @on(Worker.StateChanged)
     def _render_done(self, event: Worker.StateChanged) -> None:
-        if event.worker.group != "render":
-            return
         if event.state == WorkerState.SUCCESS:
-            self.query_one("#status-bar", Static).update(
-                f"PDF saved → {event.worker.result}"
-            )
+            self._status_set(f"PDF saved → {event.worker.result}")
         elif event.state == WorkerState.ERROR:
-            self.query_one("#status-bar", Static).update(
-                f"Render failed: {event.worker.error}"
-            )
+            self._status_set(f"Render failed: {event.worker.error}")
 
     def action_push_device(self) -> None:
         self._do_push()
@@ -686,39 +1011,32 @@ class GhostwriterApp(App):
         remote = upload("ghost.pdf")
         return remote
 
-    @on(Worker.StateChanged)
     def _push_done(self, event: Worker.StateChanged) -> None:
-        if event.worker.group != "push":
-            return
         if event.state == WorkerState.SUCCESS:
-            self.query_one("#status-bar", Static).update(
-                f"Pushed → {event.worker.result}"
-            )
+            self._status_set(f"Pushed → {event.worker.result}")
         elif event.state == WorkerState.ERROR:
-            self.query_one("#status-bar", Static).update(
-                f"Push failed: {event.worker.error}"
-            )
+            self._status_set(f"Push failed: {event.worker.error}")
 
     # ---- share (web view) ------------------------------------------------
 
     def action_share_poem(self) -> None:
         """Generate a web view of the poem and serve it locally."""
-        editor = self.query_one("#editor", TextArea)
+        editor = self._editor
         text = editor.text.strip()
         if not text:
-            self.query_one("#status-bar", Static).update("Nothing to share")
+            self._status_set("Nothing to share")
             return
-        self._do_share(text)
+        self._do_share(text, dict(self.morphed))
 
     @work(thread=True, group="share")
-    def _do_share(self, text: str) -> str:
+    def _do_share(self, text: str, morphed: dict[str, str]) -> str:
         import hashlib
         import time
         import webbrowser
 
         from ghostwriter.web import render_poem_html, start_server
 
-        page = render_poem_html(text, morphed=dict(self.morphed))
+        page = render_poem_html(text, morphed=morphed)
 
         poems_dir = Path("poems")
         poems_dir.mkdir(parents=True, exist_ok=True)
@@ -732,41 +1050,42 @@ class GhostwriterApp(App):
         webbrowser.open(url)
         return f"{url}  (poems/{poem_id}.html)"
 
-    @on(Worker.StateChanged)
     def _share_done(self, event: Worker.StateChanged) -> None:
-        if event.worker.group != "share":
-            return
         if event.state == WorkerState.SUCCESS:
-            self.query_one("#status-bar", Static).update(
-                f"Shared → {event.worker.result}"
-            )
+            self._status_set(f"Shared → {event.worker.result}")
         elif event.state == WorkerState.ERROR:
-            self.query_one("#status-bar", Static).update(
-                f"Share failed: {event.worker.error}"
-            )
+            self._status_set(f"Share failed: {event.worker.error}")
 
     # ---- save / load poem ------------------------------------------------
 
     def action_save_poem(self) -> None:
-        editor = self.query_one("#editor", TextArea)
-        Path("poem.txt").write_text(editor.text, encoding="utf-8")
-        self.query_one("#status-bar", Static).update("Saved → poem.txt")
+        editor = self._editor
+        Path("poem.txt").write_bytes(editor.text.encode("utf-8"))
+        self._status_set("Saved → poem.txt")
 
     def action_load_poem(self) -> None:
         p = Path("poem.txt")
         if not p.exists():
-            self.query_one("#status-bar", Static).update(
-                "No poem.txt found in current directory"
-            )
+            self._status_set("No poem.txt found in current directory")
             return
-        editor = self.query_one("#editor", TextArea)
-        editor.load_text(p.read_text(encoding="utf-8"))
+        editor = self._editor
+        # TextArea normalises line endings itself, so skip text-mode decoding.
+        editor.load_text(p.read_bytes().decode("utf-8", errors="replace"))
         self.morphed.clear()
+        self._morphed_rendered = ""
         self._poem_tokens = []
-        self._tokenized_text = ""
+        self._line_text = []
+        self._col_index = []
+        self._line_context_cache = []
+        self._tagged = []
+        self._pending_morph = {}
+        self._tag_batch = {}
+        if self._tag_debounce is not None:
+            self._tag_debounce.stop()
+            self._tag_debounce = None
         self._refresh_morphed_list()
-        self._refresh_tagged_panel()
-        self.query_one("#status-bar", Static).update("Loaded poem.txt")
+        self._schedule_refresh(editor=False)
+        self._status_set("Loaded poem.txt")
 
 
 # ------------------------------------------------------------------
@@ -774,7 +1093,21 @@ class GhostwriterApp(App):
 # ------------------------------------------------------------------
 
 
+def _preload_model() -> None:
+    from ghostwriter.morph import load_model
+
+    try:
+        load_model()
+    except Exception:
+        pass  # the app's model worker retries and reports the error
+
+
 def main() -> None:
+    # Start importing gensim and loading vectors while Textual boots; the
+    # app's model worker then just waits on the same load.
+    threading.Thread(
+        target=_preload_model, name="gw-preload", daemon=True
+    ).start()
     app = GhostwriterApp()
     app.run()
 
@@ -1,15 +1,19 @@
 """Thin wrapper around dpt-rp1-py for pushing PDFs to a Sony DPT-RP1.
 
-The device must already be registered (``dptrp1 register``).  This module
-shells out to the ``dptrp1`` CLI so that connection / credential discovery
-works the same way as the standalone tool.
+The device must already be registered (``dptrp1 register``).  Uploads go
+through the library in-process over one authenticated session that is kept
+alive between pushes; the occasional listing / delete still shells out to
+the ``dptrp1`` CLI.  Both use the same credential files as the standalone
+tool.
 """
 
 from __future__ import annotations
 
 import shutil
 import subprocess
+import threading
 from pathlib import Path
+from typing import Any
 
 
 REMOTE_ROOT = "Document/Ghostwriter"
@@ -29,14 +33,21 @@ def _dptrp1_bin() -> str:
     return path
 
 
-def _run(args: list[str], check: bool = True) -> subprocess.CompletedProcess[str]:
-    """Run a dptrp1 command and return the result."""
+def _run(
+    args: list[str], check: bool = True, capture: bool = True
+) -> subprocess.CompletedProcess[str]:
+    """Run a dptrp1 command and return the result.
+
+    With ``capture=False`` stdout is discarded; stderr is still collected
+    for the error message.
+    """
     bin_path = _dptrp1_bin()
     cmd = [bin_path, *args]
     try:
         return subprocess.run(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=30,
             check=check,
@@ -49,6 +60,49 @@ def _run(args: list[str], check: bool = True) -> subprocess.CompletedProcess[str
         ) from exc
 
 
+_CLIENT: Any = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> Any:
+    """Return a cached, authenticated ``DigitalPaper`` session.
+
+    Device discovery and the auth handshake happen on first use only;
+    later pushes reuse the same HTTPS session.
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            return _CLIENT
+        try:
+            from dptrp1.dptrp1 import DigitalPaper, find_auth_files
+        except ImportError as exc:
+            raise DeviceError(
+                "dpt-rp1-py not installed.  Install with: pip install dpt-rp1-py"
+            ) from exc
+
+        deviceid, privatekey = find_auth_files()
+        if not (Path(deviceid).exists() and Path(privatekey).exists()):
+            raise DeviceError("Device not registered.  Run: dptrp1 register")
+        try:
+            with open(deviceid) as fh:
+                client_id = fh.readline().strip()
+            key = Path(privatekey).read_bytes()
+            client = DigitalPaper(quiet=True)
+            client.authenticate(client_id, key)
+        except Exception as exc:
+            raise DeviceError(f"Could not connect to the reader: {exc}") from exc
+        _CLIENT = client
+        return client
+
+
+def _reset_client() -> None:
+    """Drop the cached session so the next call reconnects."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        _CLIENT = None
+
+
 # ------------------------------------------------------------------
 # Public helpers
 # ------------------------------------------------------------------
@@ -57,7 +111,7 @@ def _run(args: list[str], check: bool = True) -> subprocess.CompletedProcess[str
 def is_available() -> bool:
     """Return True if dptrp1 is installed and a device responds."""
     try:
-        result = _run(["list-documents"], check=False)
+        result = _run(["list-documents"], check=False, capture=False)
         return result.returncode == 0
     except DeviceError:
         return False
@@ -83,10 +137,14 @@ def upload(pdf_path: str | Path, remote_dir: str = REMOTE_ROOT) -> str:
 
     remote_path = f"{remote_dir}/{pdf_path.name}"
 
-    # Ensure the target directory exists (mkdir is idempotent).
-    _run(["mkdir", remote_dir], check=False)
-
-    _run(["upload", str(pdf_path), remote_path])
+    # The library creates the target folder itself when the document is new.
+    client = _get_client()
+    try:
+        with open(pdf_path, "rb") as fh:
+            client.upload(fh, remote_path)
+    except Exception as exc:
+        _reset_client()
+        raise DeviceError(f"Upload failed: {exc}") from exc
     return remote_path
 
 
@@ -99,12 +157,12 @@ def list_poems(remote_dir: str = REMOTE_ROOT) -> list[str]:
 
     prefix = remote_dir + "/"
     return [
-        line.strip()
-        for line in result.stdout.splitlines()
-        if line.strip().startswith(prefix)
+        entry
+        for entry in (line.strip() for line in result.stdout.splitlines())
+        if entry.startswith(prefix)
     ]
 
 
 def delete(remote_path: str) -> None:
     """Delete a document from the reader."""
-    _run(["delete-document", remote_path])
+    _run(["delete-document", remote_path], capture=False)
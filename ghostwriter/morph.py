@@ -17,9 +17,18 @@ target vector, then re-inflected to be drop-in replacements.
 
 from __future__ import annotations
 
+import json
+import os
 import re
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
 
 import numpy as np
 import gensim.downloader as api
@@ -31,22 +40,278 @@ from gensim.models import KeyedVectors
 
 _MODEL: Optional[KeyedVectors] = None
 _MODEL_NAME = "glove-wiki-gigaword-100"
+_LOADED_NAME: Optional[str] = None
+_MODEL_LOCK = threading.Lock()
+
+CACHE_DIR = Path(
+    os.environ.get(
+        "GHOSTWRITER_CACHE_DIR", Path.home() / ".cache" / "ghostwriter"
+    )
+)
 
 
 def load_model(name: str = _MODEL_NAME) -> KeyedVectors:
     """Load (and cache) the word-vector model.  First call downloads ~128 MB."""
-    global _MODEL
+    global _MODEL, _LOADED_NAME
     if _MODEL is None:
-        _MODEL = api.load(name)
+        # The TUI preloads from a background thread while its worker may
+        # ask too; make the second caller wait instead of loading twice.
+        with _MODEL_LOCK:
+            if _MODEL is None:
+                _MODEL = _load_vectors(name)
+                _LOADED_NAME = name
     return _MODEL
 
 
+def _load_vectors(name: str) -> KeyedVectors:
+    """Memory-map the saved copy of *name*, creating it on first run.
+
+    gensim-data ships GloVe as text, which takes tens of seconds to parse.
+    After the first download the parsed model is saved under
+    :data:`CACHE_DIR` with its vectors in a separate ``.npy`` file, and
+    later starts map that file instead of parsing anything.
+    """
+    path = CACHE_DIR / f"{name}.kv"
+    try:
+        return KeyedVectors.load(str(path), mmap="r")
+    except (OSError, EOFError, ValueError):
+        pass
+    model = api.load(name)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = f"{path}.tmp"
+        model.save(tmp, separately=["vectors"])
+        # Vectors first: the .kv file only counts as present once both are.
+        os.replace(f"{tmp}.vectors.npy", f"{path}.vectors.npy")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return model
+
+
+def warm_up() -> None:
+    """Load everything the first morph would otherwise pay for.
+
+    Loads the model, builds its search index and the emoji index, and
+    loads the NLTK tagger and WordNet.  NLTK failures are left for the
+    morph itself to handle (it degrades to untagged candidates).
+    """
+    model = load_model()
+    _search_index(model)
+    _get_emoji_index(model)
+    try:
+        _get_tagger()
+        from nltk.corpus import wordnet
+
+        wordnet.ensure_loaded()
+    except Exception:
+        pass
+
+
+_MAX_WORD_LEN = 20
+# Part of the saved search index's filename.  Bump it whenever the word
+# filter (_WORD_RE / _MAX_WORD_LEN) changes so stale rows are not reused.
+_SEARCH_INDEX_VERSION = 1
+
+_SEARCH: weakref.WeakKeyDictionary[
+    KeyedVectors, tuple[np.ndarray, np.ndarray]
+] = weakref.WeakKeyDictionary()
+
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+def _search_index(model: KeyedVectors) -> tuple[np.ndarray, np.ndarray]:
+    """Row ids and unit vectors of the words a morph is allowed to return.
+
+    Only plain lowercase words can become candidates, so numbers,
+    punctuation and non-Latin tokens — most of GloVe's vocabulary — are
+    dropped from the search matrix up front.  Built once per model; for
+    the global model it is also saved under :data:`CACHE_DIR` and
+    memory-mapped on later runs.
+    """
+    entry = _SEARCH.get(model)
+    if entry is None:
+        stem = None
+        if model is _MODEL and _LOADED_NAME:
+            n, dim = model.vectors.shape
+            stem = (
+                CACHE_DIR
+                / f"{_LOADED_NAME}.{n}x{dim}.v{_SEARCH_INDEX_VERSION}"
+            )
+            entry = _load_search_cache(stem, n, dim)
+        if entry is None:
+            match = _WORD_RE.match
+            rows = np.fromiter(
+                (
+                    i
+                    for i, w in enumerate(model.index_to_key)
+                    if len(w) <= _MAX_WORD_LEN and match(w)
+                ),
+                dtype=np.int64,
+            )
+            entry = (rows, _unit_rows(model.vectors[rows]))
+            if stem is not None:
+                _save_search_cache(stem, *entry)
+        _SEARCH[model] = entry
+    return entry
+
+
+def _load_search_cache(
+    stem: Path, n: int, dim: int
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Memory-map a saved search index, or *None* if missing / mismatched."""
+    try:
+        rows = np.load(f"{stem}.rows.npy")
+        normed = np.load(f"{stem}.search.npy", mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if (
+        normed.dtype != np.float32
+        or normed.shape != (len(rows), dim)
+        or (len(rows) and rows[-1] >= n)
+    ):
+        return None
+    return rows, normed
+
+
+def _save_search_cache(stem: Path, rows: np.ndarray, normed: np.ndarray) -> None:
+    """Write the search index next to other caches; failures are ignored.
+
+    The matrix stays float32: NumPy has no mixed float16 × float32 GEMV,
+    so a half-precision file would be upcast in full on every query.
+    """
+    try:
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        for suffix, arr in ((".rows.npy", rows), (".search.npy", normed)):
+            tmp = Path(f"{stem}{suffix}.tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp, f"{stem}{suffix}")
+    except OSError:
+        pass
+
+
+def _nearest(
+    model: KeyedVectors,
+    positive: list[str],
+    negative: list[str],
+    topn: int,
+) -> list[tuple[str, float]]:
+    """Equivalent of ``model.most_similar`` as a single matrix-vector product.
+
+    Like gensim, each input vector is normalised before they are summed,
+    the inputs themselves are excluded, and scores are cosine similarities.
+    The difference is that the searched matrix is normalised once up
+    front instead of dividing by the norms on every query, and holds only
+    the words that could become candidates (see :func:`_search_index`).
+    """
+    return _nearest_many(model, [(positive, negative)], topn)[0]
+
+
+def _nearest_many(
+    model: KeyedVectors,
+    queries: list[tuple[list[str], list[str]]],
+    topn: int,
+) -> list[list[tuple[str, float]]]:
+    """Batched :func:`_nearest` — one ``(positive, negative)`` pair per query.
+
+    All query vectors are stacked and scored with a single matrix-matrix
+    product, so the search matrix is streamed through memory once per
+    batch rather than once per word.
+    """
+    rows, normed = _search_index(model)
+    inputs: list[list[int]] = []
+    stacked = np.zeros((len(queries), normed.shape[1]), dtype=np.float32)
+    for j, (positive, negative) in enumerate(queries):
+        idx = [model.get_index(w) for w in positive + negative]
+        unit = _unit_rows(model.vectors[idx])
+        query = unit[: len(positive)].sum(axis=0)
+        if negative:
+            query -= unit[len(positive):].sum(axis=0)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query /= norm
+        stacked[j] = query
+        inputs.append(idx)
+
+    # Enough rows per query to still have *topn* after dropping the inputs.
+    k = min(topn + max(len(idx) for idx in inputs), len(rows))
+    cp = _cupy()
+    if cp is not None:
+        # Only the k best per query come back from the device.
+        all_sims = cp.asarray(stacked) @ _device_matrix(cp, model, normed).T
+        best = _top_k(cp, all_sims, k)
+        best_sims = cp.asnumpy(cp.take_along_axis(all_sims, best, axis=1))
+        best = cp.asnumpy(best)
+    else:
+        all_sims = stacked @ normed.T
+        best = _top_k(np, all_sims, k)
+        best_sims = np.take_along_axis(all_sims, best, axis=1)
+
+    keys = model.index_to_key
+    out: list[list[tuple[str, float]]] = []
+    for cand, sims, idx in zip(best, best_sims, inputs):
+        order = np.argsort(-sims, kind="stable")
+        exclude = set(idx)
+        out.append([
+            (keys[rows[i]], float(sim))
+            for i, sim in zip(cand[order], sims[order])
+            if rows[i] not in exclude
+        ][:topn])
+    return out
+
+
+def _top_k(xp: Any, sims: Any, k: int) -> Any:
+    """Column indices of the *k* largest scores in each row, unordered.
+
+    Partitions at ``n - k`` rather than negating, which would copy the
+    whole score matrix first.
+    """
+    n = sims.shape[1]
+    if k < n:
+        return xp.argpartition(sims, n - k, axis=1)[:, n - k:]
+    return xp.broadcast_to(xp.arange(n), sims.shape)
+
+
+# CuPy module once a CUDA device has been found, False if there is none.
+_CUPY: Any = None
+
+_DEVICE_SEARCH: weakref.WeakKeyDictionary[KeyedVectors, Any] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cupy() -> Any:
+    """The ``cupy`` module when a CUDA device is usable, else *None*."""
+    global _CUPY
+    if _CUPY is None:
+        try:
+            import cupy
+
+            _CUPY = cupy if cupy.cuda.runtime.getDeviceCount() > 0 else False
+        except Exception:  # not installed, or no driver / device
+            _CUPY = False
+    return _CUPY or None
+
+
+def _device_matrix(cp: Any, model: KeyedVectors, normed: np.ndarray) -> Any:
+    """The search matrix for *model*, copied to the GPU once."""
+    matrix = _DEVICE_SEARCH.get(model)
+    if matrix is None:
+        matrix = _DEVICE_SEARCH[model] = cp.asarray(normed)
+    return matrix
+
+
 # ---------------------------------------------------------------------------
 # Data types
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Candidate:
     """A single replacement suggestion for a word."""
 
@@ -54,7 +319,7 @@ class Candidate:
     score: float  # cosine similarity to target vector
 
 
-@dataclass
+@dataclass(slots=True)
 class MorphResult:
     """Result of morphing one word toward a vibe."""
 
@@ -94,6 +359,25 @@ def _ensure_nltk() -> None:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
+def _get_tagger():
+    """The perceptron tagger, loaded once.
+
+    ``nltk.pos_tag`` builds its tagger per call on some NLTK releases, which
+    reloads the model weights every time.
+    """
+    _ensure_nltk()
+    from nltk.tag import PerceptronTagger
+
+    return PerceptronTagger()
+
+
+@lru_cache(maxsize=1024)
+def _tag_context(context: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Tagged *context*; tagged words on the same line share one call."""
+    return tuple(_get_tagger().tag(list(context)))
+
+
 def _pos_tag_word(
     word: str, context: list[str] | None = None
 ) -> str | None:
@@ -104,20 +388,52 @@ def _pos_tag_word(
     "understanding" (noun in "a deep understanding" vs. verb in
     "understanding the problem").
     """
+    if context:
+        try:
+            tagged = _tag_context(tuple(context))
+        except Exception:
+            return None
+        low = word.lower()
+        for w, tag in tagged:
+            if w.lower() == low:
+                return tag
+    # Fallback: tag in isolation
+    return _pos_tag_isolated(word)
+
+
+# Isolated-word tags.  Every candidate is tagged on its own and the same
+# neighbours come up across morphs, so tags are kept for the session.
+_POS_CACHE: dict[str, str | None] = {}
+_POS_CACHE_MAX = 32768
+
+
+def _pos_tag_isolated(word: str) -> str | None:
+    """POS tag for *word* on its own."""
     try:
-        _ensure_nltk()
-        from nltk.tag import pos_tag as _pos_tag
-
-        if context:
-            tagged = _pos_tag(context)
-            low = word.lower()
-            for w, tag in tagged:
-                if w.lower() == low:
-                    return tag
-        # Fallback: tag in isolation
-        return _pos_tag([word])[0][1]
-    except Exception:
-        return None
+        return _POS_CACHE[word]
+    except KeyError:
+        return _pos_tag_many([word])[0]
+
+
+def _pos_tag_many(words: list[str]) -> list[str | None]:
+    """Isolated POS tags for *words*.
+
+    Uncached words are tagged in a single ``tag_sents`` call, each as its
+    own one-word sentence so no word's tag depends on its neighbours.
+    """
+    missing = [w for w in dict.fromkeys(words) if w not in _POS_CACHE]
+    fresh: dict[str, str | None] = {}
+    if missing:
+        try:
+            tagger = _get_tagger()
+            tagged = tagger.tag_sents([[w] for w in missing])
+            fresh = {w: sent[0][1] for w, sent in zip(missing, tagged)}
+        except Exception:
+            return [_POS_CACHE.get(w) for w in words]
+        if len(_POS_CACHE) + len(fresh) > _POS_CACHE_MAX:
+            _POS_CACHE.clear()
+        _POS_CACHE.update(fresh)
+    return [fresh[w] if w in fresh else _POS_CACHE.get(w) for w in words]
 
 
 def _ptb_to_wordnet(tag: str):
@@ -153,6 +469,7 @@ def _coarse_pos(tag: str | None) -> str | None:
 _COARSE_TO_WN: dict[str, str] = {}  # populated on first call
 
 
+@lru_cache(maxsize=65536)
 def _can_be_pos(word: str, coarse: str) -> bool:
     """Check if *word* genuinely functions as *coarse* POS via WordNet.
 
@@ -178,11 +495,12 @@ def _can_be_pos(word: str, coarse: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def _wordnet_synonyms(lemma: str, wn_pos) -> set[str]:
+@lru_cache(maxsize=4096)
+def _wordnet_synonyms(lemma: str, wn_pos) -> frozenset[str]:
     """All single-word synonyms from WordNet for a lemma + POS.
 
     Includes direct synonyms plus one hop of hypernyms, hyponyms, and
-    similar-tos for broader coverage.
+    similar-tos for broader coverage.  Cached, hence the frozenset.
     """
     from nltk.corpus import wordnet
 
@@ -201,7 +519,7 @@ def _wordnet_synonyms(lemma: str, wn_pos) -> set[str]:
                 w = lem.name().lower()
                 if "_" not in w and w != lemma:
                     out.add(w)
-    return out
+    return frozenset(out)
 
 
 # ---------------------------------------------------------------------------
@@ -209,11 +527,17 @@ def _wordnet_synonyms(lemma: str, wn_pos) -> set[str]:
 # ---------------------------------------------------------------------------
 
 
-def _lemmatize(word: str, wn_pos) -> str:
-    """Reduce a word to its base form."""
+@lru_cache(maxsize=1)
+def _get_lemmatizer():
     from nltk.stem import WordNetLemmatizer
 
-    return WordNetLemmatizer().lemmatize(word, pos=wn_pos)
+    return WordNetLemmatizer()
+
+
+@lru_cache(maxsize=65536)
+def _lemmatize(word: str, wn_pos) -> str:
+    """Reduce a word to its base form."""
+    return _get_lemmatizer().lemmatize(word, pos=wn_pos)
 
 
 def _inflect(word: str, target_tag: str) -> str:
@@ -272,95 +596,301 @@ def morph_word(
     -------
     MorphResult with ranked candidates that match POS and inflection.
     """
-    if model is None:
+    key = _result_key(word, target_vibe, source_vibe, top_n, context)
+    if model is None or model is _MODEL:
         model = load_model()
+        ranked = _cached_result(key)
+        if ranked is None:
+            ranked, tagged = _morph_ranked(model, *key)
+            _store_result(key, ranked, persist=tagged)
+    else:
+        ranked, _ = _morph_ranked(model, *key)
+    return _make_result(word, target_vibe, source_vibe, ranked)
+
+
+# Ranked results for the global model, most recently used last.  Re-morphing
+# the same word toward the same vibe (e.g. re-tagging it mid-cycle) then
+# skips the similarity search entirely.
+_RESULTS: OrderedDict[tuple, tuple[tuple[str, float], ...]] = OrderedDict()
+_RESULTS_MAX = 512
+_RESULTS_LOCK = threading.Lock()
+
+# Every ranked result is also written to a SQLite file under CACHE_DIR, so
+# vibes revisited after a restart skip the search as well.  Bump
+# _RESULTS_VERSION whenever ranking or filtering changes so old rows stop
+# matching; the least recently used rows beyond _DB_MAX_ROWS are pruned.
+_RESULTS_VERSION = 1
+_DB_SCHEMA = 1
+_DB_MAX_ROWS = 50_000
+_DB_PRUNE_EVERY = 1_000
+_DB: Optional[sqlite3.Connection] = None
+_DB_FAILED = False
+_DB_LOCK = threading.Lock()
+_db_inserts = 0
+
+
+def _result_key(
+    word: str,
+    target_vibe: str,
+    source_vibe: str | None,
+    top_n: int,
+    context: list[str] | None,
+) -> tuple:
+    return (
+        word.lower(),
+        target_vibe.lower(),
+        source_vibe.lower() if source_vibe else None,
+        top_n,
+        tuple(context) if context else None,
+    )
 
-    result = MorphResult(original=word, vibe=target_vibe, source_vibe=source_vibe)
 
-    low = word.lower()
-    vibe_low = target_vibe.lower()
+def _cached_result(key: tuple) -> tuple[tuple[str, float], ...] | None:
+    with _RESULTS_LOCK:
+        ranked = _RESULTS.get(key)
+        if ranked is not None:
+            _RESULTS.move_to_end(key)
+            return ranked
+    ranked = _load_result(key)
+    if ranked is not None:
+        _remember_result(key, ranked)
+    return ranked
+
+
+def _store_result(
+    key: tuple, ranked: tuple[tuple[str, float], ...], persist: bool = True
+) -> None:
+    """Cache *ranked*; with ``persist=False`` only for this session."""
+    _remember_result(key, ranked)
+    if persist:
+        _save_result(key, ranked)
+
+
+def _remember_result(key: tuple, ranked: tuple[tuple[str, float], ...]) -> None:
+    with _RESULTS_LOCK:
+        _RESULTS[key] = ranked
+        _RESULTS.move_to_end(key)
+        while len(_RESULTS) > _RESULTS_MAX:
+            _RESULTS.popitem(last=False)
+
+
+def _db() -> Optional[sqlite3.Connection]:
+    """Open the on-disk result cache; *None* if it can't be used.
+
+    Callers must hold :data:`_DB_LOCK`.
+    """
+    global _DB, _DB_FAILED
+    if _DB is None and not _DB_FAILED:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(CACHE_DIR / "morph.db", check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            if db.execute("PRAGMA user_version").fetchone()[0] != _DB_SCHEMA:
+                # Older layout without the last-used column: start afresh.
+                with db:
+                    db.execute("DROP TABLE IF EXISTS results")
+                    db.execute(f"PRAGMA user_version = {_DB_SCHEMA}")
+            with db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS results "
+                    "(k TEXT PRIMARY KEY, v TEXT NOT NULL, used REAL NOT NULL)"
+                )
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS results_used ON results (used)"
+                )
+            _prune_db(db)
+            _DB = db
+        except (OSError, sqlite3.Error):
+            _DB_FAILED = True
+    return _DB
+
+
+def _prune_db(db: sqlite3.Connection) -> None:
+    """Drop the least recently used rows beyond :data:`_DB_MAX_ROWS`."""
+    (count,) = db.execute("SELECT COUNT(*) FROM results").fetchone()
+    if count > _DB_MAX_ROWS:
+        with db:
+            db.execute(
+                "DELETE FROM results WHERE k IN "
+                "(SELECT k FROM results ORDER BY used LIMIT ?)",
+                (count - _DB_MAX_ROWS,),
+            )
+
+
+def _disk_key(key: tuple) -> str:
+    # Results depend on the ranking code and the model, so both the
+    # version and the model name are part of the key.
+    return json.dumps([_RESULTS_VERSION, _LOADED_NAME, *key])
+
+
+def _load_result(key: tuple) -> tuple[tuple[str, float], ...] | None:
+    with _DB_LOCK:
+        db = _db()
+        if db is None:
+            return None
+        k = _disk_key(key)
+        try:
+            row = db.execute("SELECT v FROM results WHERE k = ?", (k,)).fetchone()
+            if row is not None:
+                with db:
+                    db.execute(
+                        "UPDATE results SET used = ? WHERE k = ?", (time.time(), k)
+                    )
+        except sqlite3.Error:
+            return None
+    if row is None:
+        return None
+    return tuple((w, s) for w, s in json.loads(row[0]))
+
+
+def _save_result(key: tuple, ranked: tuple[tuple[str, float], ...]) -> None:
+    """Persist *ranked*; failures only cost the cache entry."""
+    global _db_inserts
+    with _DB_LOCK:
+        db = _db()
+        if db is None:
+            return
+        try:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO results (k, v, used) VALUES (?, ?, ?)",
+                    (_disk_key(key), json.dumps(ranked), time.time()),
+                )
+            _db_inserts += 1
+            if _db_inserts % _DB_PRUNE_EVERY == 0:
+                _prune_db(db)
+        except sqlite3.Error:
+            pass
+
+
+def _make_result(
+    word: str,
+    target_vibe: str,
+    source_vibe: str | None,
+    ranked: tuple[tuple[str, float], ...],
+) -> MorphResult:
+    return MorphResult(
+        original=word,
+        vibe=target_vibe,
+        source_vibe=source_vibe,
+        candidates=[Candidate(word=w, score=s) for w, s in ranked],
+    )
+
 
+def _search_terms(
+    model: KeyedVectors, low: str, vibe_low: str, source_low: str | None
+) -> tuple[list[str], list[str]]:
+    """``(positive, negative)`` words for the embedding-neighbour search."""
+    if source_low and _in_vocab(model, source_low):
+        return [low, vibe_low], [source_low]
+    return [low, vibe_low], []
+
+
+def _morph_ranked(
+    model: KeyedVectors,
+    low: str,
+    vibe_low: str,
+    source_low: str | None,
+    top_n: int,
+    context: tuple[str, ...] | None,
+    neighbours: list[tuple[str, float]] | None = None,
+) -> tuple[tuple[tuple[str, float], ...], bool]:
+    """Ranked ``(replacement, score)`` pairs for :func:`morph_word`.
+
+    *neighbours* are the precomputed embedding neighbours when the caller
+    already searched for them as part of a batch.
+
+    Also returns whether the word was POS-tagged.  When the tagger is
+    unavailable the ranking runs without its POS filters, so it should not
+    be persisted.
+    """
     if not _in_vocab(model, low) or not _in_vocab(model, vibe_low):
-        return result
+        return (), True
 
     # -- POS & lemma --------------------------------------------------------
-    ptb_tag = _pos_tag_word(low, context=context)
+    ptb_tag = _pos_tag_word(low, context=list(context) if context else None)
     wn_pos = _ptb_to_wordnet(ptb_tag) if ptb_tag else None
     coarse = _coarse_pos(ptb_tag)
     lemma = _lemmatize(low, wn_pos) if wn_pos else low
 
     # -- Build target vector (word + vibe − source_vibe) --------------------
-    target_vec = model[low].astype(np.float64) + model[vibe_low].astype(np.float64)
-    if source_vibe and _in_vocab(model, source_vibe.lower()):
-        target_vec -= model[source_vibe.lower()].astype(np.float64)
+    # Stay in the model's float32; the sum is the only new array.
+    target_vec = model[low] + model[vibe_low]
+    if source_low and _in_vocab(model, source_low):
+        target_vec -= model[source_low]
     norm = np.linalg.norm(target_vec)
     if norm > 0:
         target_vec /= norm
 
     # -- Candidate pool (base-form words) -----------------------------------
-    pool: set[str] = set()
+    # Insertion-ordered, so ties in the final ranking don't depend on
+    # string hash randomisation the way set iteration order does.
+    pool: dict[str, None] = {}
+    wn_cands = _wordnet_synonyms(lemma, wn_pos) if wn_pos else frozenset()
+    if neighbours is None:
+        positive, negative = _search_terms(model, low, vibe_low, source_low)
+        try:
+            neighbours = _nearest(model, positive, negative, topn=top_n * 5)
+        except KeyError:
+            neighbours = []
 
     # Source 1: WordNet synonyms — POS-filtered to catch cross-POS leaks
-    # from the one-hop expansion (hypernyms / similar-tos).
-    if wn_pos:
-        wn_cands = _wordnet_synonyms(lemma, wn_pos)
-        if coarse:
-            wn_cands = {
-                w for w in wn_cands
-                if _coarse_pos(_pos_tag_word(w)) == coarse
-            }
-        pool |= wn_cands
+    # from the one-hop expansion (hypernyms / similar-tos).  WordNet itself
+    # says whether a word can take the POS, which is both cheaper and more
+    # reliable than the tagger on isolated words.
+    if coarse:
+        wn_cands = {w for w in wn_cands if _can_be_pos(w, coarse)}
+    pool.update(dict.fromkeys(sorted(wn_cands)))
+
+    same_pos: set[str] | None = None
+    if coarse:
+        # Tag the neighbours in one batch and keep the set whose coarse
+        # POS matches the original.
+        words = [w.lower() for w, _ in neighbours]
+        same_pos = {
+            w for w, tag in zip(words, _pos_tag_many(words))
+            if _coarse_pos(tag) == coarse
+        }
 
     # Source 2: embedding neighbours via vector arithmetic
-    positive = [low, vibe_low]
-    negative: list[str] = []
-    if source_vibe and _in_vocab(model, source_vibe.lower()):
-        negative = [source_vibe.lower()]
-    try:
-        raw = model.most_similar(
-            positive=positive,
-            negative=negative or None,
-            topn=top_n * 5,
-        )
-        for cand_word, _score in raw:
-            cw = cand_word.lower()
-            if cw in (low, vibe_low, lemma):
-                continue
-            if not _WORD_RE.match(cw):
-                continue
-            # Hard POS filter: only keep same coarse POS
-            if coarse:
-                cand_tag = _pos_tag_word(cw)
-                if _coarse_pos(cand_tag) != coarse:
-                    continue
-            # Lemmatize so the pool is always base forms
-            if wn_pos:
-                cw = _lemmatize(cw, wn_pos)
-            if cw in (low, vibe_low, lemma):
-                continue
-            pool.add(cw)
-    except KeyError:
-        pass
-
-    # -- Score each candidate against the target vector ---------------------
-    scored: list[tuple[str, float]] = []
-    for cand in pool:
-        if not _in_vocab(model, cand):
+    for cand_word, _score in neighbours:
+        cw = cand_word.lower()
+        if cw in (low, vibe_low, lemma):
+            continue
+        if not _WORD_RE.match(cw):
             continue
-        # WordNet cross-check: reject words that cannot genuinely serve
-        # the target POS (catches NLTK tagger errors on isolated words).
-        if coarse and not _can_be_pos(cand, coarse):
+        # Hard POS filter: only keep same coarse POS
+        if same_pos is not None and cw not in same_pos:
             continue
-        cand_vec = model[cand].astype(np.float64)
-        cand_norm = np.linalg.norm(cand_vec)
-        if cand_norm == 0:
+        # Lemmatize so the pool is always base forms
+        if wn_pos:
+            cw = _lemmatize(cw, wn_pos)
+        if cw in (low, vibe_low, lemma):
             continue
-        sim = float(np.dot(target_vec, cand_vec) / cand_norm)
-        scored.append((cand, sim))
+        pool[cw] = None
 
-    scored.sort(key=lambda x: x[1], reverse=True)
+    # -- Score each candidate against the target vector ---------------------
+    # WordNet cross-check: reject words that cannot genuinely serve the
+    # target POS (catches NLTK tagger errors on isolated words).
+    kept = [
+        cand for cand in pool
+        if _in_vocab(model, cand) and (not coarse or _can_be_pos(cand, coarse))
+    ]
+    scored: list[tuple[str, float]] = []
+    if kept:
+        # One matrix-vector product for the whole pool instead of a dot per
+        # candidate; stable argsort keeps the old tie order.
+        cand_vecs = model.vectors[[model.key_to_index[c] for c in kept]]
+        cand_norms = np.linalg.norm(cand_vecs, axis=1)
+        nonzero = cand_norms > 0
+        sims = np.zeros(len(kept))
+        sims[nonzero] = (cand_vecs[nonzero] @ target_vec) / cand_norms[nonzero]
+        order = np.argsort(-sims, kind="stable")
+        scored = [(kept[i], float(sims[i])) for i in order if nonzero[i]]
 
     # -- Inflect to match original form & deduplicate -----------------------
+    ranked: list[tuple[str, float]] = []
     seen: set[str] = set()
     for cand_lemma, score in scored:
         inflected = _inflect(cand_lemma, ptb_tag) if ptb_tag else cand_lemma
@@ -368,13 +898,11 @@ def morph_word(
         if il in seen or il == low:
             continue
         seen.add(il)
-        result.candidates.append(
-            Candidate(word=inflected, score=round(score, 4))
-        )
-        if len(result.candidates) >= top_n:
+        ranked.append((inflected, round(score, 4)))
+        if len(ranked) >= top_n:
             break
 
-    return result
+    return tuple(ranked), ptb_tag is not None
 
 
 def morph_words(
@@ -389,17 +917,43 @@ def morph_words(
     *contexts*, when provided, should be a list of word-lists — one per
     entry in *words* — giving the surrounding line so the POS tagger can
     disambiguate.
+
+    Words not already cached share one batched neighbour search.
     """
     model = load_model()
     if contexts is None:
         contexts = [None] * len(words)  # type: ignore[list-item]
-    return [
-        morph_word(
-            w, target_vibe, source_vibe,
-            top_n=top_n, model=model, context=ctx,
-        )
+    keys = [
+        _result_key(w, target_vibe, source_vibe, top_n, ctx)
         for w, ctx in zip(words, contexts)
     ]
+    found = {key: _cached_result(key) for key in keys}
+    todo = [
+        key
+        for key, ranked in found.items()
+        if ranked is None
+        and _in_vocab(model, key[0])
+        and _in_vocab(model, key[1])
+    ]
+    if todo:
+        batch = _nearest_many(
+            model,
+            [_search_terms(model, *key[:3]) for key in todo],
+            topn=top_n * 5,
+        )
+        for key, neighbours in zip(todo, batch):
+            found[key], tagged = _morph_ranked(
+                model, *key, neighbours=neighbours
+            )
+            _store_result(key, found[key], persist=tagged)
+    for key, ranked in found.items():
+        if ranked is None:  # out of vocabulary
+            found[key], tagged = _morph_ranked(model, *key)
+            _store_result(key, found[key], persist=tagged)
+    return [
+        _make_result(w, target_vibe, source_vibe, found[key])
+        for w, key in zip(words, keys)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -412,8 +966,10 @@ _EMOJI_STOP = frozenset({
     "light", "medium", "dark",
 })
 
-_EMOJI_INDEX: dict[str, np.ndarray] | None = None
+# Emoji char -> row of _EMOJI_MATRIX, which holds the unit meaning vectors.
+_EMOJI_INDEX: dict[str, int] | None = None
 _EMOJI_CHARS: list[str] | None = None
+_EMOJI_MATRIX: np.ndarray | None = None
 
 
 _EMOJI_RANGES = [
@@ -427,12 +983,15 @@ _EMOJI_RANGES = [
 ]
 
 
-def _build_emoji_index(model: KeyedVectors) -> tuple[dict[str, np.ndarray], list[str]]:
-    """Build a mapping from emoji char to its meaning vector."""
+def _build_emoji_index(
+    model: KeyedVectors,
+) -> tuple[dict[str, int], list[str], np.ndarray]:
+    """Build the emoji meaning vectors, one matrix row per emoji char."""
     import unicodedata
 
-    index: dict[str, np.ndarray] = {}
     chars: list[str] = []
+    starts: list[int] = []
+    keyword_rows: list[int] = []
 
     for start, end in _EMOJI_RANGES:
         for cp in range(start, end + 1):
@@ -446,25 +1005,31 @@ def _build_emoji_index(model: KeyedVectors) -> tuple[dict[str, np.ndarray], list
                 continue
 
             keywords = [w.lower() for w in name.split() if w.lower() not in _EMOJI_STOP]
-            vecs = [model[k].astype(np.float64) for k in keywords if _in_vocab(model, k)]
-            if not vecs:
+            found = [model.get_index(k) for k in keywords if _in_vocab(model, k)]
+            if not found:
                 continue
-
-            mean = np.mean(vecs, axis=0)
-            norm = np.linalg.norm(mean)
-            if norm > 0:
-                mean /= norm
-            index[ch] = mean
+            starts.append(len(keyword_rows))
+            keyword_rows.extend(found)
             chars.append(ch)
 
-    return index, chars
+    if not chars:
+        return {}, [], np.zeros((0, model.vector_size), np.float32)
 
+    # One segmented sum over all keyword vectors gives each emoji's summed
+    # keywords; normalising the sum gives the same unit vector as the mean.
+    sums = np.add.reduceat(model.vectors[keyword_rows], starts, axis=0)
+    matrix = _unit_rows(sums)
+    index = {ch: i for i, ch in enumerate(chars)}
+    return index, chars, matrix
 
-def _get_emoji_index(model: KeyedVectors) -> tuple[dict[str, np.ndarray], list[str]]:
-    global _EMOJI_INDEX, _EMOJI_CHARS
+
+def _get_emoji_index(
+    model: KeyedVectors,
+) -> tuple[dict[str, int], list[str], np.ndarray]:
+    global _EMOJI_INDEX, _EMOJI_CHARS, _EMOJI_MATRIX
     if _EMOJI_INDEX is None:
-        _EMOJI_INDEX, _EMOJI_CHARS = _build_emoji_index(model)
-    return _EMOJI_INDEX, _EMOJI_CHARS
+        _EMOJI_INDEX, _EMOJI_CHARS, _EMOJI_MATRIX = _build_emoji_index(model)
+    return _EMOJI_INDEX, _EMOJI_CHARS, _EMOJI_MATRIX
 
 
 def is_emoji(text: str) -> bool:
@@ -493,7 +1058,7 @@ def morph_emoji(
 
     result = MorphResult(original=emoji, vibe=target_vibe, source_vibe=None)
 
-    index, chars = _get_emoji_index(model)
+    index, chars, matrix = _get_emoji_index(model)
 
     # For ZWJ sequences, use the first base emoji for lookup
     lookup = emoji
@@ -506,26 +1071,29 @@ def morph_emoji(
     if not _in_vocab(model, vibe_low):
         return result
 
-    source_vec = index[lookup]
-    vibe_vec = model[vibe_low].astype(np.float64)
+    source_vec = matrix[index[lookup]]
+    # model[...] is a view into the (possibly read-only) vectors; no in-place ops.
+    vibe_vec = model[vibe_low]
     vibe_norm = np.linalg.norm(vibe_vec)
     if vibe_norm > 0:
-        vibe_vec /= vibe_norm
+        vibe_vec = vibe_vec / vibe_norm
 
     target_vec = source_vec + vibe_vec
     norm = np.linalg.norm(target_vec)
     if norm > 0:
         target_vec /= norm
 
-    # Score all emojis by cosine similarity to the target
-    scored: list[tuple[str, float]] = []
-    for ch in chars:
-        if ch == emoji:
-            continue
-        score = float(np.dot(index[ch], target_vec))
-        scored.append((ch, score))
-
-    scored.sort(key=lambda x: x[1], reverse=True)
+    # Score all emojis by cosine similarity to the target in one product;
+    # only the best top_n (plus the input itself) get sorted.
+    sims = matrix @ target_vec
+    k = min(top_n + 1, len(sims))
+    if k < len(sims):
+        # Back in index order so ties keep the order of the full sort.
+        best = np.sort(np.argpartition(sims, len(sims) - k)[len(sims) - k:])
+    else:
+        best = np.arange(len(sims))
+    best = best[np.argsort(-sims[best], kind="stable")]
+    scored = [(chars[i], float(sims[i])) for i in best if chars[i] != emoji]
 
     for ch, score in scored[:top_n]:
         result.candidates.append(Candidate(word=ch, score=round(score, 4)))
@@ -15,6 +15,7 @@ import logging
 import os
 import socket
 import threading
+from functools import lru_cache
 
 from flask import Flask, jsonify, request
 
@@ -37,10 +38,12 @@ def _preload() -> None:
     global _model_ready, _preload_error
     try:
         log.info("PRELOAD: starting gensim import...")
-        from ghostwriter.morph import load_model
+        from ghostwriter.morph import warm_up
 
         log.info("PRELOAD: gensim imported, loading model...")
-        load_model()
+        # Also builds the search / emoji indexes and loads NLTK, so the
+        # first /morph doesn't pay for them.
+        warm_up()
         _model_ready = True
         log.info("PRELOAD: model ready!")
     except Exception as e:
@@ -50,6 +53,22 @@ def _preload() -> None:
 
 threading.Thread(target=_preload, daemon=True).start()
 
+# ---------------------------------------------------------------------------
+# Result caching
+# ---------------------------------------------------------------------------
+# Word results are memoised inside ghostwriter.morph (in memory and on
+# disk), keyed on word, vibe and context.  Emoji results are not, so the
+# service keeps its own bounded cache of them, already serialised.
+
+
+@lru_cache(maxsize=16384)
+def _emoji_entry(emoji: str, vibe: str) -> tuple[str, tuple[tuple[str, float], ...]]:
+    from ghostwriter.morph import morph_emoji
+
+    mr = morph_emoji(emoji, vibe)
+    return mr.original, tuple((c.word, c.score) for c in mr.candidates)
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -78,23 +97,35 @@ def morph():
     vibe = data.get("vibe", "")
     words = data.get("words", [])
 
-    from ghostwriter.morph import morph_word, morph_emoji, is_emoji
+    from ghostwriter.morph import morph_words, is_emoji
+
+    # Plain words go through morph_words together so the whole request
+    # shares one neighbour search; emojis are scored on their own.
+    is_emo = [bool(item.get("isEmoji")) or is_emoji(item["word"]) for item in words]
+    plain = [item for item, emo in zip(words, is_emo) if not emo]
+    morphed = iter(
+        morph_words(
+            [item["word"] for item in plain],
+            vibe,
+            contexts=[item.get("context") or None for item in plain],
+        )
+        if plain
+        else ()
+    )
 
     results = []
-    for item in words:
-        if item.get("isEmoji") or is_emoji(item["word"]):
-            mr = morph_emoji(item["word"], vibe)
+    for item, emo in zip(words, is_emo):
+        if emo:
+            original, ranked = _emoji_entry(item["word"], vibe)
         else:
-            mr = morph_word(
-                item["word"],
-                vibe,
-                context=item.get("context") or None,
-            )
+            mr = next(morphed)
+            original = mr.original
+            ranked = tuple((c.word, c.score) for c in mr.candidates)
         results.append(
             {
-                "original": mr.original,
+                "original": original,
                 "candidates": [
-                    {"word": c.word, "score": c.score} for c in mr.candidates
+                    {"word": w, "score": score} for w, score in ranked
                 ],
             }
         )
@@ -120,7 +151,13 @@ def main() -> None:
     print(f"               ->  http://{ip}:{port}")
     print()
     print("Loading embeddings in background (first run downloads ~128 MB)...")
-    app.run(host="0.0.0.0", port=port, debug=False)
+    if os.environ.get("FLASK_DEBUG"):
+        app.run(host="0.0.0.0", port=port, debug=True, use_reloader=False)
+        return
+    # A real WSGI server; its worker threads share the one loaded model.
+    from waitress import serve
+
+    serve(app, host="0.0.0.0", port=port, threads=8)
 
 
 if __name__ == "__main__":
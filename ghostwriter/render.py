@@ -9,11 +9,12 @@ compared to the surrounding text.
 
 from __future__ import annotations
 
-import random
+import math
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.pdfgen.canvas import Canvas
@@ -24,6 +25,9 @@ from reportlab.pdfgen.canvas import Canvas
 
 PAGE_W, PAGE_H = A4  # 595.27 × 841.89 pt  ≈  210 × 297 mm
 
+# Stripped from a token's ends before checking it against morphed_words.
+_PUNCT = ".,;:!?\"'()[]—–-"
+
 
 @dataclass
 class GhostStyle:
@@ -68,20 +72,30 @@ def _draw_ghosted_word(
     jitter_xy: float,
     jitter_angle: float,
     fade_step: float,
+    unit: np.ndarray,
 ) -> None:
-    """Draw *text* at (x, y) with *layers* overlapping jittered copies."""
-    for i in range(layers):
-        off_x = random.uniform(-jitter_xy, jitter_xy)
-        off_y = random.uniform(-jitter_xy, jitter_xy)
-        angle = random.uniform(-jitter_angle, jitter_angle)
-        gray = i * fade_step
+    """Draw *text* at (x, y) with *layers* overlapping jittered copies.
 
-        c.saveState()
-        c.translate(x + off_x, y + off_y)
-        c.rotate(angle)
-        c.setFillColorRGB(gray, gray, gray)
-        c.drawString(0, 0, text)
-        c.restoreState()
+    *unit* holds one pre-drawn ``(x, y, angle)`` row in [-1, 1) per layer,
+    scaled here by the jitter amounts.
+    """
+    # All layers go into one text object: each is a fill gray, a text
+    # matrix carrying the offset and rotation, and the string — instead of
+    # a save / translate / rotate / draw / restore round per layer.
+    t = c.beginText()
+    for i, (ux, uy, ua) in enumerate(unit[:layers].tolist()):
+        off_x = ux * jitter_xy
+        off_y = uy * jitter_xy
+        angle = math.radians(ua * jitter_angle)
+        cos, sin = math.cos(angle), math.sin(angle)
+
+        t.setFillGray(i * fade_step)
+        t.setTextTransform(cos, sin, -sin, cos, x + off_x, y + off_y)
+        t.textOut(text)
+    # Keep the last layer's gray from leaking into later drawing.
+    c.saveState()
+    c.drawText(t)
+    c.restoreState()
 
 
 # ---------------------------------------------------------------------------
@@ -119,13 +133,35 @@ def render_poem(
     -------
     Path to the written PDF.
     """
-    if seed is not None:
-        random.seed(seed)
-
     style = style or GhostStyle()
     morphed_words = morphed_words or set()
     output = Path(output)
 
+    # Split and classify every token first so the jitter for the whole
+    # page can be drawn in one call; blank lines (stanza breaks) are None.
+    # Poems repeat a small vocabulary, so each distinct token is checked
+    # against morphed_words once.
+    morph_layers = style.layers + style.morph_extra_layers
+    total = style.layers if title else 0
+    flags: dict[str, bool] = {}
+    rows: list[Optional[list[tuple[str, bool]]]] = []
+    for line in lines:
+        if not line.strip():
+            rows.append(None)
+            continue
+        row = []
+        for token in line.split(" "):
+            is_morphed = flags.get(token)
+            if is_morphed is None:
+                is_morphed = flags[token] = (
+                    token.strip(_PUNCT).lower() in morphed_words
+                )
+            row.append((token, is_morphed))
+            total += morph_layers if is_morphed else style.layers
+        rows.append(row)
+    jitter = np.random.default_rng(seed).uniform(-1.0, 1.0, size=(total, 3))
+    used = 0
+
     c = Canvas(str(output), pagesize=A4)
 
     usable_width = PAGE_W - style.margin_left - style.margin_right
@@ -144,14 +180,19 @@ def render_poem(
             jitter_xy=style.jitter_xy * 0.5,
             jitter_angle=style.jitter_angle * 0.3,
             fade_step=style.fade_step,
+            unit=jitter[used:],
         )
+        used += style.layers
         cursor_y -= style.title_font_size * 2.2
 
     c.setFont(style.font_name, style.font_size)
+    space_w = c.stringWidth(" ", style.font_name, style.font_size)
+    # Repeated words ("the", "and", ...) are measured once per render.
+    widths: dict[str, float] = {}
 
-    for line in lines:
+    for row in rows:
         # Stanza break
-        if line.strip() == "":
+        if row is None:
             cursor_y -= leading * style.stanza_gap_lines
             continue
 
@@ -163,11 +204,13 @@ def render_poem(
 
         # Render word-by-word so morphed words get their own effect
         x = style.margin_left
-        tokens = line.split(" ")
-        space_w = c.stringWidth(" ", style.font_name, style.font_size)
 
-        for token in tokens:
-            word_w = c.stringWidth(token, style.font_name, style.font_size)
+        for token, is_morphed in row:
+            word_w = widths.get(token)
+            if word_w is None:
+                word_w = widths[token] = c.stringWidth(
+                    token, style.font_name, style.font_size
+                )
 
             # Soft-wrap if the word would exceed the right margin
             if x + word_w > PAGE_W - style.margin_right and x > style.margin_left:
@@ -178,20 +221,17 @@ def render_poem(
                     c.setFont(style.font_name, style.font_size)
                     cursor_y = PAGE_H - style.margin_top
 
-            # Is this a morphed word?
-            stripped = token.strip(".,;:!?\"'()[]—–-").lower()
-            is_morphed = stripped in morphed_words
-
             if is_morphed:
                 # Extra ghost layers for morphed words
-                total_layers = style.layers + style.morph_extra_layers
                 _draw_ghosted_word(
                     c, token, x, cursor_y,
-                    layers=total_layers,
+                    layers=morph_layers,
                     jitter_xy=style.morph_jitter_xy,
                     jitter_angle=style.morph_jitter_angle,
                     fade_step=style.morph_fade_step,
+                    unit=jitter[used:],
                 )
+                used += morph_layers
             else:
                 _draw_ghosted_word(
                     c, token, x, cursor_y,
@@ -199,7 +239,9 @@ def render_poem(
                     jitter_xy=style.jitter_xy,
                     jitter_angle=style.jitter_angle,
                     fade_step=style.fade_step,
+                    unit=jitter[used:],
                 )
+                used += style.layers
 
             x += word_w + space_w
 
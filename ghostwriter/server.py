@@ -20,6 +20,8 @@ import re
 import socket
 import threading
 import time
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from flask import (
@@ -29,6 +31,7 @@ from flask import (
     redirect,
     render_template,
     request,
+    send_file,
     session,
     url_for,
 )
@@ -60,6 +63,25 @@ app.secret_key = os.environ.get(
 # Ensure poems directory exists at startup
 POEMS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Patterns used to parse a saved page for its OG image.
+_TITLE_RE = re.compile(r"<title>(.*?)</title>")
+_DESC_RE = re.compile(r'og:description" content="(.*?)"')
+_HAS_TITLE_RE = re.compile(r'ghostwriter:has-title" content="(\w+)"')
+_CYCLING_RE = re.compile(
+    r"data-original=\"([^\"]*)\"\s*"
+    r"data-case=\"([^\"]*)\"\s*"
+    r"data-words='(\[[^']*\])'"
+    r"[^>]*>([^<]+)<"
+)
+
+_HEX = frozenset("0123456789abcdef")
+
+
+def _valid_poem_id(poem_id: str) -> bool:
+    """True for an 8-character lowercase hex id, as minted by api_save."""
+    return len(poem_id) == 8 and _HEX.issuperset(poem_id)
+
+
 # ---------------------------------------------------------------------------
 # Auth helpers
 # ---------------------------------------------------------------------------
@@ -87,6 +109,7 @@ def _is_authenticated() -> bool:
 
 _model_ready = False
 _preload_error: str | None = None
+_preload_thread: threading.Thread | None = None
 
 if MORPH_SERVICE_URL:
     log.info("Using external morph service at %s", MORPH_SERVICE_URL)
@@ -107,41 +130,141 @@ else:
             _preload_error = str(e)
             log.exception("PRELOAD ERROR: %s", e)
 
-    threading.Thread(target=_preload, daemon=True).start()
+    _preload_thread = threading.Thread(target=_preload, daemon=True)
+    _preload_thread.start()
 
 # ---------------------------------------------------------------------------
 # Pages
 # ---------------------------------------------------------------------------
 
 
+_META_SPAN = 2048
+_DESC_OPEN = 'og:description" content="'
+
+
+def _extract_meta(content: str) -> tuple[str, str]:
+    """Return the raw (still escaped) title and og:description of a poem page.
+
+    Both tags sit at the top of ``<head>``, so each opening marker is only
+    looked for within a short span rather than across the whole page.
+    """
+    title = desc = ""
+    i = content.find("<title>", 0, _META_SPAN)
+    start = 0
+    if i >= 0:
+        j = content.find("</title>", i + 7)
+        if j >= 0:
+            title = content[i + 7 : j]
+            start = j
+    k = content.find(_DESC_OPEN, start, start + _META_SPAN)
+    if k >= 0:
+        k += len(_DESC_OPEN)
+        end = content.find('"', k)
+        if end >= 0:
+            desc = content[k:end]
+    return title, desc
+
+
+# Gallery listing, keyed on the poems directory's mtime (which changes
+# whenever a poem is added or removed), plus each poem's (mtime, title,
+# desc) so a rebuild only reads files that are new or changed.
+_gallery_cache: tuple[int, list[dict]] | None = None
+_gallery_meta: dict[str, tuple[float, str, str]] = {}
+_gallery_lock = threading.Lock()
+# Bumped on every save / delete, so the gallery ETag changes even when the
+# directory mtime's granularity hides a quick add-then-remove.
+_gallery_gen = 0
+
+
+def _invalidate_gallery(
+    poem_id: str | None = None, meta: tuple[float, str, str] | None = None
+) -> None:
+    """Drop the cached listing; record or forget *poem_id*'s metadata."""
+    global _gallery_cache, _gallery_gen
+    with _gallery_lock:
+        _gallery_cache = None
+        _gallery_gen += 1
+        if poem_id is not None:
+            if meta is None:
+                _gallery_meta.pop(poem_id, None)
+            else:
+                _gallery_meta[poem_id] = meta
+
+
+def _gallery_writings() -> list[dict]:
+    global _gallery_cache, _gallery_meta
+    try:
+        mtime = POEMS_DIR.stat().st_mtime_ns
+    except OSError:
+        return []
+    with _gallery_lock:
+        cached = _gallery_cache
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # One directory read; DirEntry.stat() reuses what scandir already has
+    # where the platform allows instead of a fresh stat per Path.
+    with os.scandir(POEMS_DIR) as it:
+        entries = [
+            (e.name[:-5], e.path, e.stat().st_mtime)
+            for e in it
+            if e.name.endswith(".html")
+        ]
+    entries.sort(key=lambda t: t[2], reverse=True)
+
+    known = _gallery_meta
+    meta: dict[str, tuple[float, str, str]] = {}
+    writings: list[dict] = []
+    for stem, path, mtime_s in entries:
+        hit = known.get(stem)
+        if hit is None or hit[0] != mtime_s:
+            # Only the <head> matters here; skip the poem body.
+            with open(path, "rb") as fh:
+                head = fh.read(4096).decode("utf-8", "replace")
+            hit = (mtime_s, *_extract_meta(head))
+        meta[stem] = hit
+        _, title, desc = hit
+        writings.append(
+            {
+                "id": stem,
+                "title": title or stem,
+                "desc": desc,
+                "date": time.strftime(
+                    "%b %d, %Y at %I:%M %p", time.localtime(mtime_s)
+                ),
+            }
+        )
+    with _gallery_lock:
+        _gallery_cache = (mtime, writings)
+        # Rebuilt from this listing, so deleted poems drop out.
+        _gallery_meta = meta
+    return writings
+
+
 @app.route("/")
 def index():
-    writings: list[dict] = []
-    if POEMS_DIR.exists():
-        for f in sorted(
-            POEMS_DIR.glob("*.html"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        ):
-            content = f.read_text(encoding="utf-8")
-            title_m = re.search(r"<title>(.*?)</title>", content)
-            desc_m = re.search(r'og:description" content="(.*?)"', content)
-            writings.append(
-                {
-                    "id": f.stem,
-                    "title": title_m.group(1) if title_m else f.stem,
-                    "desc": desc_m.group(1) if desc_m else "",
-                    "date": time.strftime(
-                        "%b %d, %Y at %I:%M %p",
-                        time.localtime(f.stat().st_mtime),
-                    ),
-                }
+    authenticated = _is_authenticated()
+    try:
+        mtime = POEMS_DIR.stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    # Browsers revalidate on every visit: the page must reflect saves,
+    # deletes and logouts at once, but an unchanged gallery costs a 304.
+    # Logged-in users also see delete buttons, so that is part of the tag.
+    etag = f"{mtime}-{_gallery_gen}-{int(authenticated)}"
+    if request.if_none_match.contains(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.make_response(
+            render_template(
+                "gallery.html",
+                writings=_gallery_writings(),
+                authenticated=authenticated,
             )
-    return render_template(
-        "gallery.html",
-        writings=writings,
-        authenticated=_is_authenticated(),
-    )
+        )
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "private, no-cache"
+    return resp
 
 
 @app.route("/login", methods=["GET", "POST"])
@@ -175,14 +298,25 @@ def write():
     return render_template("editor.html", api_key=API_KEY)
 
 
+@lru_cache(maxsize=512)
+def _read_poem(poem_id: str) -> str:
+    """Saved pages are immutable, so keep recently viewed ones in memory."""
+    return (POEMS_DIR / f"{poem_id}.html").read_text(encoding="utf-8")
+
+
 @app.route("/p/<poem_id>")
 def view_poem(poem_id: str):
-    if not re.fullmatch(r"[a-f0-9]{8}", poem_id):
+    if not _valid_poem_id(poem_id):
         return "Not found", 404
-    path = POEMS_DIR / f"{poem_id}.html"
-    if not path.exists():
+    try:
+        body = _read_poem(poem_id)
+    except FileNotFoundError:
         return "Not found", 404
-    return path.read_text(encoding="utf-8")
+    resp = app.make_response(body)
+    # A poem's id is derived at save time and its page is never rewritten.
+    resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    resp.set_etag(poem_id)
+    return resp.make_conditional(request)
 
 
 def _parse_og_content(poem_id: str):
@@ -190,21 +324,21 @@ def _parse_og_content(poem_id: str):
     import html as _html_mod
     import json as _json_mod
 
-    if not re.fullmatch(r"[a-f0-9]{8}", poem_id):
+    if not _valid_poem_id(poem_id):
         return None
-    path = POEMS_DIR / f"{poem_id}.html"
-    if not path.exists():
+    try:
+        content = _read_poem(poem_id)
+    except FileNotFoundError:
         return None
 
-    content = path.read_text(encoding="utf-8")
-    title_m = re.search(r"<title>(.*?)</title>", content)
+    title_m = _TITLE_RE.search(content)
     title = _html_mod.unescape(title_m.group(1)) if title_m else "Untitled"
 
     # Check if an explicit title was provided
-    has_title_m = re.search(r'ghostwriter:has-title" content="(\w+)"', content)
+    has_title_m = _HAS_TITLE_RE.search(content)
     has_title = has_title_m and has_title_m.group(1) == "yes" if has_title_m else False
 
-    desc_m = re.search(r'og:description" content="(.*?)"', content)
+    desc_m = _DESC_RE.search(content)
     desc = _html_mod.unescape(desc_m.group(1)) if desc_m else ""
 
     if " \u2022 " in desc:
@@ -215,13 +349,7 @@ def _parse_og_content(poem_id: str):
         lines = [desc] if desc else []
 
     cycling = []
-    for m in re.finditer(
-        r"data-original=\"([^\"]*)\"\s*"
-        r"data-case=\"([^\"]*)\"\s*"
-        r"data-words='(\[[^']*\])'"
-        r"[^>]*>([^<]+)<",
-        content,
-    ):
+    for m in _CYCLING_RE.finditer(content):
         words = _json_mod.loads(_html_mod.unescape(m.group(3)))
         if len(words) > 1:
             cycling.append(
@@ -235,8 +363,21 @@ def _parse_og_content(poem_id: str):
     return title, has_title, lines, cycling
 
 
+_OG_FONTS: tuple | None = None
+_OG_FONTS_LOCK = threading.Lock()
+
+
 def _load_og_fonts():
-    """Load and return (font_brand, font_title, font_body, font_emoji)."""
+    """Return (font_brand, font_title, font_body, font_emoji), loaded once."""
+    global _OG_FONTS
+    if _OG_FONTS is None:
+        with _OG_FONTS_LOCK:
+            if _OG_FONTS is None:
+                _OG_FONTS = _open_og_fonts()
+    return _OG_FONTS
+
+
+def _open_og_fonts():
     from PIL import ImageFont
 
     def _load(paths: list[str], size: int):
@@ -279,8 +420,15 @@ _EMOJI_SEQ_RE = re.compile(
 )
 
 
+# Lowest code point _EMOJI_COMPONENT can match; a line whose largest
+# character sorts below it has no emoji to find.
+_EMOJI_FLOOR = "\u203c"
+
+
 def _segment_line(text: str) -> list[tuple[str, str]]:
     """Split text into ('text', ...) and ('emoji', ...) segments."""
+    if text.isascii() or max(text) < _EMOJI_FLOOR:
+        return [("text", text)] if text else []
     segs: list[tuple[str, str]] = []
     last = 0
     for m in _EMOJI_SEQ_RE.finditer(text):
@@ -293,6 +441,33 @@ def _segment_line(text: str) -> list[tuple[str, str]]:
     return segs
 
 
+@lru_cache(maxsize=1024)
+def _emoji_glyph(seq: str, target_h: int):
+    """Return *seq* drawn from the emoji font and scaled to *target_h* px.
+
+    Shared across frames and requests, so callers only paste the image and
+    must never modify it.  None when no emoji font is available.
+    """
+    from PIL import Image, ImageDraw
+
+    font_emoji = _load_og_fonts()[3]
+    if not font_emoji:
+        return None
+    try:
+        bbox = font_emoji.getbbox(seq)
+        if not bbox or bbox[2] - bbox[0] == 0:
+            return None
+        ew, eh = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        tmp = Image.new("RGBA", (ew + 20, eh + 20), (0, 0, 0, 0))
+        ImageDraw.Draw(tmp).text(
+            (-bbox[0], -bbox[1]), seq, font=font_emoji, embedded_color=True
+        )
+        ratio = target_h / eh
+        return tmp.resize((max(1, int(ew * ratio)), target_h), Image.LANCZOS)
+    except Exception:
+        return None
+
+
 _OG_W, _OG_H = 1200, 630
 _OG_BG = (250, 248, 245)
 _OG_ACCENT = (122, 78, 45)
@@ -301,97 +476,130 @@ _OG_MUTED = (176, 160, 144)
 
 
 def _render_og_frame(
-    title, lines, font_brand, font_title, font_body, font_emoji,
+    title, lines, font_brand, font_title, font_body,
     *, show_title=False,
 ):
     """Return an RGB PIL Image for one OG frame."""
     from PIL import Image, ImageDraw
 
-    img = Image.new("RGBA", (_OG_W, _OG_H), _OG_BG + (255,))
+    # Drawn straight onto RGB: the background is opaque, and emoji tiles
+    # carry their own alpha as the paste mask.
+    img = Image.new("RGB", (_OG_W, _OG_H), _OG_BG)
     draw = ImageDraw.Draw(img)
 
-    def _render_emoji(seq, target_h):
-        if not font_emoji:
-            return None
-        try:
-            bbox = font_emoji.getbbox(seq)
-            if not bbox or bbox[2] - bbox[0] == 0:
-                return None
-            ew, eh = bbox[2] - bbox[0], bbox[3] - bbox[1]
-            tmp = Image.new("RGBA", (ew + 20, eh + 20), (0, 0, 0, 0))
-            ImageDraw.Draw(tmp).text(
-                (-bbox[0], -bbox[1]), seq, font=font_emoji, embedded_color=True
-            )
-            ratio = target_h / eh
-            return tmp.resize((max(1, int(ew * ratio)), target_h), Image.LANCZOS)
-        except Exception:
-            return None
-
     def _draw_line(x, y, text, fill, text_font, emoji_h):
-        for kind, seg in _segment_line(text):
+        segs = _segment_line(text)
+        if len(segs) == 1 and segs[0][0] == "text":
+            # No emoji: one draw, and nothing after it needs the advance.
+            draw.text((x, y), text, fill=fill, font=text_font)
+            return
+        for kind, seg in segs:
             if kind == "emoji":
-                ei = _render_emoji(seg, emoji_h)
+                ei = _emoji_glyph(seg, emoji_h)
                 if ei:
                     img.paste(ei, (x, y), ei)
                     x += ei.width + 2
             else:
                 draw.text((x, y), seg, fill=fill, font=text_font)
-                bbox = text_font.getbbox(seg)
-                x += (bbox[2] - bbox[0]) if bbox else len(seg) * 12
+                x += int(text_font.getlength(seg))
 
     LM = 250
 
-    draw.text((LM, 100), "ghostwriter", fill=_OG_MUTED + (255,), font=font_brand)
+    draw.text((LM, 100), "ghostwriter", fill=_OG_MUTED, font=font_brand)
 
     y = 170
     if show_title:
-        _draw_line(LM, y, title[:50], _OG_ACCENT + (255,), font_title, 44)
+        _draw_line(LM, y, title[:50], _OG_ACCENT, font_title, 44)
         y = 250
 
     for ln in lines[:6]:
-        _draw_line(LM, y, ln[:60], _OG_FG + (255,), font_body, 30)
+        _draw_line(LM, y, ln[:60], _OG_FG, font_body, 30)
         y += 46
 
-    flat = Image.new("RGB", img.size, _OG_BG)
-    flat.paste(img, mask=img.split()[3])
-    return flat
+    return img
 
 
 def _apply_case(word: str, case_type: str) -> str:
     if case_type == "upper":
         return word.upper()
     if case_type == "title":
-        return word[0].upper() + word[1:]
+        return word[:1].upper() + word[1:]
     return word
 
 
 @app.route("/og/<poem_id>.png")
 def og_image(poem_id: str):
     """Static OG image (backwards compatibility)."""
+    from flask import Response
+
+    if not _valid_poem_id(poem_id):
+        return "Not found", 404
+    # Scrapers revalidate often; answer a matching ETag before touching
+    # the cache or the poem file.
+    if request.if_none_match.contains(poem_id):
+        resp = Response(status=304)
+        resp.set_etag(poem_id)
+        return resp
+    try:
+        data = _og_png_bytes(poem_id)
+    except FileNotFoundError:
+        return "Not found", 404
+    except ImportError:
+        return Response("Pillow not installed", status=500)
+
+    resp = Response(
+        data,
+        mimetype="image/png",
+        headers={"Cache-Control": "public, max-age=86400, immutable"},
+    )
+    resp.set_etag(poem_id)
+    return resp
+
+
+@lru_cache(maxsize=128)
+def _og_png_bytes(poem_id: str) -> bytes:
+    """Encoded OG PNG for *poem_id*, rendered once and kept in og_cache.
+
+    Raises FileNotFoundError if the poem does not exist.
+    """
     import io
 
+    cache_path = POEMS_DIR / "og_cache" / f"{poem_id}.png"
+    try:
+        return cache_path.read_bytes()
+    except FileNotFoundError:
+        pass
+
     parsed = _parse_og_content(poem_id)
     if not parsed:
-        return "Not found", 404
+        raise FileNotFoundError(poem_id)
     title, has_title, lines, _ = parsed
 
-    try:
-        fb, ft, fbo, fe = _load_og_fonts()
-        img = _render_og_frame(title, lines, fb, ft, fbo, fe, show_title=has_title)
-        buf = io.BytesIO()
-        img.save(buf, format="PNG", optimize=True)
-        buf.seek(0)
-        from flask import Response
-
-        return Response(
-            buf.getvalue(),
-            mimetype="image/png",
-            headers={"Cache-Control": "public, max-age=86400"},
-        )
-    except ImportError:
-        from flask import Response
-
-        return Response("Pillow not installed", status=500)
+    fb, ft, fbo, _ = _load_og_fonts()
+    img = _render_og_frame(title, lines, fb, ft, fbo, show_title=has_title)
+    buf = io.BytesIO()
+    # Default zlib level: optimize=True took ~2.5x as long for ~6% smaller
+    # output, and the result is cached so this runs once per poem.
+    img.save(buf, format="PNG")
+    data = buf.getvalue()
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, cache_path)
+    return data
+
+
+def _send_og_gif(cache_path: Path):
+    """Serve a cached OG GIF with the same headers on every response."""
+    # Let Werkzeug stream the file (and answer conditional requests with
+    # its ETag) instead of reading it into memory.
+    resp = send_file(
+        cache_path, mimetype="image/gif", max_age=86400, conditional=True
+    )
+    resp.cache_control.public = True
+    resp.cache_control.immutable = True
+    return resp
 
 
 @app.route("/og/<poem_id>.gif")
@@ -399,17 +607,11 @@ def og_image_gif(poem_id: str):
     """Animated OG image — cycles through alternative words."""
     import io
 
-    from flask import Response
-
     # Serve from cache if available
     cache_dir = POEMS_DIR / "og_cache"
     cache_path = cache_dir / f"{poem_id}.gif"
     if cache_path.exists():
-        return Response(
-            cache_path.read_bytes(),
-            mimetype="image/gif",
-            headers={"Cache-Control": "public, max-age=86400"},
-        )
+        return _send_og_gif(cache_path)
 
     parsed = _parse_og_content(poem_id)
     if not parsed:
@@ -423,76 +625,82 @@ def og_image_gif(poem_id: str):
         from PIL import Image, ImageDraw, ImageFont
 
         W, H = 1200, 630
-        fb, ft, fbo, fe = _load_og_fonts()
+        fb, ft, fbo, _ = _load_og_fonts()
 
         max_words = max(len(c["words"]) for c in cycling)
         num_frames = min(max_words, 4)
 
         LM = 250
 
-        def _render_emoji_small(seq, target_h):
-            if not fe:
-                return None
-            try:
-                bbox = fe.getbbox(seq)
-                if not bbox or bbox[2] - bbox[0] == 0:
-                    return None
-                ew, eh = bbox[2] - bbox[0], bbox[3] - bbox[1]
-                tmp = Image.new("RGBA", (ew + 20, eh + 20), (0, 0, 0, 0))
-                ImageDraw.Draw(tmp).text(
-                    (-bbox[0], -bbox[1]), seq, font=fe, embedded_color=True
-                )
-                ratio = target_h / eh
-                return tmp.resize((max(1, int(ew * ratio)), target_h), Image.LANCZOS)
-            except Exception:
-                return None
-
         def _draw_line_gif(img, draw, x, y, text, fill, text_font, emoji_h):
-            for kind, seg in _segment_line(text):
+            segs = _segment_line(text)
+            if len(segs) == 1 and segs[0][0] == "text":
+                draw.text((x, y), text, fill=fill, font=text_font)
+                return
+            for kind, seg in segs:
                 if kind == "emoji":
-                    ei = _render_emoji_small(seg, emoji_h)
+                    ei = _emoji_glyph(seg, emoji_h)
                     if ei:
                         img.paste(ei, (x, y), ei)
                         x += ei.width + 2
                 else:
                     draw.text((x, y), seg, fill=fill, font=text_font)
-                    bbox = text_font.getbbox(seg)
-                    x += (bbox[2] - bbox[0]) if bbox else len(seg) * 12
+                    x += int(text_font.getlength(seg))
 
-        def _render_simple(frame_title, frame_lines):
-            img = Image.new("RGBA", (W, H), _OG_BG + (255,))
-            draw = ImageDraw.Draw(img)
-            draw.text((LM, 100), "ghostwriter", fill=_OG_MUTED + (255,), font=fb)
+        def _frame_rows(frame_title, frame_lines):
+            """(top, band height, text, fill, font, emoji height) per line."""
+            rows = []
             y = 170
             if has_title:
-                _draw_line_gif(img, draw, LM, y, frame_title[:50], _OG_ACCENT + (255,), ft, 44)
+                rows.append((y, 80, frame_title[:50], _OG_ACCENT, ft, 44))
                 y = 250
             for ln in frame_lines[:6]:
-                _draw_line_gif(img, draw, LM, y, ln[:60], _OG_FG + (255,), fbo, 30)
+                rows.append((y, 46, ln[:60], _OG_FG, fbo, 30))
                 y += 46
-            flat = Image.new("RGB", img.size, _OG_BG)
-            flat.paste(img, mask=img.split()[3])
-            return flat
+            return rows
 
-        frames = []
+        def _draw_rows(img, draw, rows):
+            for y, _, text, fill, font, emoji_h in rows:
+                _draw_line_gif(img, draw, LM, y, text, fill, font, emoji_h)
+
+        # Case each alternative once, not once per frame.
+        cased_words = [
+            [_apply_case(w, c["case"]) for w in c["words"]] for c in cycling
+        ]
+        frame_rows = []
         for fi in range(num_frames):
             frame_title = title
             frame_lines = list(lines)
-            for c in cycling:
-                word = c["words"][fi % len(c["words"])]
-                cased = _apply_case(word, c["case"])
+            for c, variants in zip(cycling, cased_words):
+                cased = variants[fi % len(variants)]
                 frame_title = frame_title.replace(c["current"], cased)
                 frame_lines = [ln.replace(c["current"], cased) for ln in frame_lines]
-            frames.append(_render_simple(frame_title, frame_lines))
-
-        # Use first frame's palette for all frames (fast, consistent)
+            frame_rows.append(_frame_rows(frame_title, frame_lines))
+
+        # Render the first frame in full.  Later frames start from a copy
+        # of it and only repaint the lines whose text differs: each line
+        # owns a full-width band, so it can be cleared and redrawn alone.
+        base = Image.new("RGB", (W, H), _OG_BG)
+        draw = ImageDraw.Draw(base)
+        draw.text((LM, 100), "ghostwriter", fill=_OG_MUTED, font=fb)
+        _draw_rows(base, draw, frame_rows[0])
+        frames = [base]
+        for rows in frame_rows[1:]:
+            img = base.copy()
+            draw = ImageDraw.Draw(img)
+            changed = [r for r, r0 in zip(rows, frame_rows[0]) if r[2] != r0[2]]
+            for y, band_h, *_ in changed:
+                draw.rectangle((0, y, W - 1, y + band_h - 1), fill=_OG_BG)
+            _draw_rows(img, draw, changed)
+            frames.append(img)
+
+        # Median-cut the first frame only; later frames are mapped onto its
+        # palette (undithered, like the first) rather than re-quantized.
         palette_img = frames[0].quantize(colors=128, method=2)
-        palette = palette_img.getpalette()
-        gif_frames = []
-        for f in frames:
-            q = f.quantize(colors=128, method=2)
-            q.putpalette(palette)
-            gif_frames.append(q)
+        gif_frames = [palette_img] + [
+            f.quantize(palette=palette_img, dither=Image.Dither.NONE)
+            for f in frames[1:]
+        ]
 
         buf = io.BytesIO()
         gif_frames[0].save(
@@ -503,20 +711,15 @@ def og_image_gif(poem_id: str):
             duration=2500,
             loop=0,
         )
-        buf.seek(0)
-        data = buf.getvalue()
-
-        # Cache to disk
+        # Cache to disk, then serve the file so the first response carries
+        # the same headers and ETag as every later one.
         cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_path.write_bytes(data)
-
-        return Response(
-            data,
-            mimetype="image/gif",
-            headers={"Cache-Control": "public, max-age=86400"},
-        )
+        tmp = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(buf.getvalue())
+        os.replace(tmp, cache_path)
     except ImportError:
         return redirect(f"/og/{poem_id}.png")
+    return _send_og_gif(cache_path)
 
 
 # ---------------------------------------------------------------------------
@@ -548,50 +751,70 @@ def api_debug():
     data_dir = Path("/data")
     gensim_path = Path(gensim_dir)
 
-    def tree(p: Path, depth: int = 2) -> list:
+    def tree(p: Path, depth: int = 2, budget: list[int] | None = None) -> list:
+        # At most 200 entries per directory and 500 lines per call, so a
+        # large volume can't make this endpoint slow or huge.
+        if budget is None:
+            budget = [500]
         items = []
         if not p.exists():
             return [f"(not found: {p})"]
         try:
-            for child in sorted(p.iterdir()):
+            with os.scandir(p) as it:
+                children = sorted(islice(it, 201), key=lambda e: e.name)
+            more = len(children) > 200
+            for child in children[:200]:
+                if budget[0] <= 0:
+                    items.append("(truncated)")
+                    break
+                budget[0] -= 1
                 info = f"{child.name}/"
-                if child.is_file():
-                    info = f"{child.name} ({child.stat().st_size:,} bytes)"
+                if child.is_file(follow_symlinks=False):
+                    size = child.stat(follow_symlinks=False).st_size
+                    info = f"{child.name} ({size:,} bytes)"
                 items.append(info)
-                if child.is_dir() and depth > 0:
-                    for sub in tree(child, depth - 1):
+                if child.is_dir(follow_symlinks=False) and depth > 0:
+                    for sub in tree(Path(child.path), depth - 1, budget):
                         items.append(f"  {sub}")
+            else:
+                if more:
+                    items.append("(more entries not shown)")
         except PermissionError:
             items.append("(permission denied)")
         return items
 
     disk = shutil.disk_usage("/data") if data_dir.exists() else None
-    return jsonify(
-        {
-            "gensim_data_dir_env": gensim_dir,
-            "gensim_path_exists": gensim_path.exists(),
-            "gensim_contents": tree(gensim_path),
-            "data_contents": tree(data_dir),
-            "disk": {
-                "total_mb": disk.total // (1024 * 1024),
-                "used_mb": disk.used // (1024 * 1024),
-                "free_mb": disk.free // (1024 * 1024),
-            }
-            if disk
-            else None,
-            "model_ready": _model_ready,
-            "preload_error": _preload_error,
-            "preload_thread_alive": any(
-                t.name == "Thread-1" or "_preload" in str(t)
-                for t in threading.enumerate()
-            ),
-            "active_threads": [t.name for t in threading.enumerate()],
+    info: dict = {
+        "gensim_data_dir_env": gensim_dir,
+        "gensim_path_exists": gensim_path.exists(),
+        "gensim_contents": tree(gensim_path),
+        "data_contents": tree(data_dir),
+        "disk": {
+            "total_mb": disk.total // (1024 * 1024),
+            "used_mb": disk.used // (1024 * 1024),
+            "free_mb": disk.free // (1024 * 1024),
         }
-    )
+        if disk
+        else None,
+        "model_ready": _model_ready,
+        "preload_error": _preload_error,
+        "preload_thread_alive": (
+            _preload_thread is not None and _preload_thread.is_alive()
+        ),
+    }
+    # Walking every live thread is only done on request (?threads=1).
+    if request.args.get("threads"):
+        info["active_threads"] = [t.name for t in threading.enumerate()]
+    return jsonify(info)
 
 
 @app.route("/api/morph", methods=["POST"])
 def api_morph():
+    # Shed load while the model is still loading, before any other work
+    # (always True when proxying to MORPH_SERVICE_URL).
+    if not _model_ready:
+        return jsonify({"error": "Model still loading..."}), 503, {"Retry-After": "5"}
+
     _require_api_key()
 
     if MORPH_SERVICE_URL:
@@ -623,25 +846,29 @@ def api_morph():
         except urllib.error.URLError as e:
             return jsonify({"error": f"Morph service unavailable: {e.reason}"}), 503
 
-    if not _model_ready:
-        return jsonify({"error": "Model still loading..."}), 503
-
     data = request.get_json()
     vibe = data.get("vibe", "")
     words = data.get("words", [])
 
-    from ghostwriter.morph import morph_word, morph_emoji, is_emoji
+    from ghostwriter.morph import morph_words, morph_emoji, is_emoji
+
+    # Plain words go through morph_words together so the whole request
+    # shares one neighbour search; emojis are scored on their own.
+    is_emo = [bool(item.get("isEmoji")) or is_emoji(item["word"]) for item in words]
+    plain = [item for item, emo in zip(words, is_emo) if not emo]
+    morphed = iter(
+        morph_words(
+            [item["word"] for item in plain],
+            vibe,
+            contexts=[item.get("context") or None for item in plain],
+        )
+        if plain
+        else ()
+    )
 
     results = []
-    for item in words:
-        if item.get("isEmoji") or is_emoji(item["word"]):
-            mr = morph_emoji(item["word"], vibe)
-        else:
-            mr = morph_word(
-                item["word"],
-                vibe,
-                context=item.get("context") or None,
-            )
+    for item, emo in zip(words, is_emo):
+        mr = morph_emoji(item["word"], vibe) if emo else next(morphed)
         results.append(
             {
                 "original": mr.original,
@@ -658,12 +885,17 @@ def api_morph():
 def api_delete(writing_id: str):
     if not _is_authenticated():
         abort(403)
-    if not re.fullmatch(r"[a-f0-9]{8}", writing_id):
+    if not _valid_poem_id(writing_id):
         return jsonify({"error": "Invalid id"}), 400
     path = POEMS_DIR / f"{writing_id}.html"
     if not path.exists():
         return jsonify({"error": "Not found"}), 404
     path.unlink()
+    for suffix in (".png", ".gif"):
+        (POEMS_DIR / "og_cache" / f"{writing_id}{suffix}").unlink(missing_ok=True)
+    _read_poem.cache_clear()
+    _og_png_bytes.cache_clear()
+    _invalidate_gallery(writing_id)
     return jsonify({"ok": True})
 
 
@@ -677,9 +909,9 @@ def api_save():
     title = data.get("title") or None
 
     POEMS_DIR.mkdir(parents=True, exist_ok=True)
-    poem_id = hashlib.sha256(
-        f"{time.time():.6f}{text[:100]}".encode()
-    ).hexdigest()[:8]
+    poem_id = hashlib.blake2b(
+        f"{time.time():.6f}{text[:100]}".encode(), digest_size=4
+    ).hexdigest()
 
     # Always use https for OG URLs (Fly.io proxies as http internally)
     scheme = "https" if request.headers.get("X-Forwarded-Proto") == "https" or request.host != "localhost" else "http"
@@ -688,7 +920,14 @@ def api_save():
     from ghostwriter.web import render_poem_html
 
     html = render_poem_html(text, morphed=morphed, title=title, base_url=base_url)
-    (POEMS_DIR / f"{poem_id}.html").write_text(html, encoding="utf-8")
+    # Write beside the target and rename into place so /p/<id> and the
+    # gallery never see a half-written page; the temp name is not *.html.
+    tmp = POEMS_DIR / f".{poem_id}.{os.getpid()}.tmp"
+    tmp.write_text(html, encoding="utf-8")
+    path = POEMS_DIR / f"{poem_id}.html"
+    os.replace(tmp, path)
+    # The gallery's metadata comes straight from the page just written.
+    _invalidate_gallery(poem_id, (path.stat().st_mtime, *_extract_meta(html)))
 
     return jsonify({"id": poem_id, "url": f"/p/{poem_id}", "full_url": base_url})
 
@@ -720,7 +959,15 @@ def main() -> None:
         print("API key          ->  (none, open access)")
     print()
     print("Loading embeddings in background (first run downloads ~128 MB)...")
-    app.run(host="0.0.0.0", port=port, debug=False)
+    if os.environ.get("FLASK_DEBUG"):
+        app.run(host="0.0.0.0", port=port, debug=True, use_reloader=False)
+        return
+    # Worker threads share the module caches; the gallery listing and OG
+    # fonts are guarded by locks, the lru_caches are thread-safe, and
+    # _model_ready only ever flips from False to True.
+    from waitress import serve
+
+    serve(app, host="0.0.0.0", port=port, threads=int(os.environ.get("WEB_THREADS", 8)))
 
 
 if __name__ == "__main__":